@@ -0,0 +1,156 @@
+"""Bitset classes: class creation, construction from members, membership."""
+
+import itertools
+import pickle
+import random
+
+import bitsets
+
+SIZES = [64, 2_000, 100_000]
+
+COUNTER = itertools.count()
+
+
+def make_class(size):
+    return bitsets.bitset(f'Bench{size}', tuple(range(size)))
+
+
+def random_members(size, density=0.5, *, seed=42):
+    rng = random.Random(seed)
+    return [i for i in range(size) if rng.random() < density]
+
+
+def bench_make_class(size):
+    members = tuple(range(size))
+    return lambda: bitsets.bitset(f'Bench{next(COUNTER)}', members)
+
+
+def bench_make_class_range(size):
+    members = range(size)
+    return lambda: bitsets.bitset(f'Bench{next(COUNTER)}', members)
+
+
+def bench_frommembers(size, density):
+    cls, members = make_class(size), random_members(size, density)
+    return lambda: cls.frommembers(members)
+
+
+def bench_frommembers_set_sum(size, density):
+    cls, members = make_class(size), random_members(size, density)
+    return lambda: cls.fromint(sum(map(cls._map.__getitem__, set(members))))
+
+
+def bench_frommembers_range(size, density):
+    cls = bitsets.bitset(f'Range{size}', range(size))
+    members = random_members(size, density)
+    return lambda: cls.frommembers(members)
+
+
+def bench_frombools_compress(size, density):
+    cls, members = make_class(size), random_members(size, density)
+    bools = cls.frommembers(members).bools()
+    return lambda: cls.fromint(sum(itertools.compress(cls._atoms, bools)))
+
+
+def bench_frombools(size, density):
+    cls, members = make_class(size), random_members(size, density)
+    bools = cls.frommembers(members).bools()
+    return lambda: cls.frombools(bools)
+
+
+def bench_contains(size):
+    cls, members = make_class(size), random_members(size)
+    bs, member = cls.frommembers(members), size // 2
+    return lambda: member in bs
+
+
+def bench_contains_range(size):
+    cls = bitsets.bitset(f'Range{size}', range(size))
+    bs, member = cls.frommembers(random_members(size)), size // 2
+    return lambda: member in bs
+
+
+def bench_bools(size):
+    cls, members = make_class(size), random_members(size)
+    bs = cls.frommembers(members)
+    return lambda: bs.bools()
+
+
+def bench_accumulate_union(size):
+    cls, members = make_class(size), random_members(size, 0.1)
+
+    def accumulate():
+        result = cls.infimum
+        for m in members:
+            result = result.union([m])
+        return result
+
+    return accumulate
+
+
+def bench_accumulate_or(size):
+    cls, members = make_class(size), random_members(size, 0.1)
+
+    def accumulate():
+        result = cls.infimum
+        for m in members:
+            result |= cls._map[m]
+        return cls.frombitset(result)
+
+    return accumulate
+
+
+def bench_accumulate_builder(size):
+    cls, members = make_class(size), random_members(size, 0.1)
+
+    def accumulate():
+        builder = cls.Builder()
+        for m in members:
+            builder.add(m)
+        return builder.freeze()
+
+    return accumulate
+
+
+def bench_issubset_members(size):
+    cls, members = make_class(size), random_members(size, 0.1)
+    bs, other = cls.frommembers(members[::2]), frozenset(members)
+    return lambda: bs.issubset(other)
+
+
+def bench_union_pairwise(size):
+    cls = make_class(size)
+    others = [cls.frommembers(random_members(size, 0.1, seed=s)) for s in range(10)]
+
+    def union():
+        result = cls.infimum
+        for o in others:
+            result = result.union(o)
+        return result
+
+    return union
+
+
+def bench_union_nary(size):
+    cls = make_class(size)
+    others = [cls.frommembers(random_members(size, 0.1, seed=s)) for s in range(10)]
+    return lambda: cls.infimum.union(*others)
+
+
+def bench_fromint(size):
+    cls = make_class(size)
+    ints = [random.Random(s).getrandbits(size) for s in range(100)] * 10
+    return lambda: list(map(cls.fromint, ints))
+
+
+def bench_fromint_interned(size):
+    cls = bitsets.bitset(f'Interned{size}', tuple(range(size)))
+    cls.intern()
+    ints = [random.Random(s).getrandbits(size) for s in range(100)] * 10
+    return lambda: list(map(cls.fromint, ints))
+
+
+def bench_loads_class(size):
+    cls = make_class(size)
+    data = pickle.dumps(cls)
+    return lambda: pickle.loads(data)
@@ -0,0 +1,42 @@
+"""Powerset generators."""
+
+import collections
+
+import bitsets
+from bitsets import combos
+
+SIZES = [12, 16]
+
+
+def shortlex_queue(start, other):
+    """Former breadth-first implementation of ``combos.shortlex``."""
+    yield start
+    queue = collections.deque([(start, other)])
+    while queue:
+        (current, other) = queue.popleft()
+        while other:
+            (first, other) = other[0], other[1:]
+            result = current | first
+            yield result
+            if other:
+                queue.append((result, other))
+
+
+def bench_shortlex_queue(size):
+    atoms = [1 << i for i in range(size)]
+    return lambda: collections.deque(shortlex_queue(0, atoms), maxlen=0)
+
+
+def bench_shortlex(size):
+    atoms = [1 << i for i in range(size)]
+    return lambda: collections.deque(combos.shortlex(0, atoms), maxlen=0)
+
+
+def bench_shortlex_atoms(size):
+    atoms = [1 << i for i in range(size)]
+    return lambda: collections.deque(combos.shortlex_atoms(0, atoms), maxlen=0)
+
+
+def bench_powerset(size):
+    cls = bitsets.bitset(f'Bench{size}', tuple(range(size)))
+    return lambda: collections.deque(cls.supremum.powerset(), maxlen=0)
@@ -0,0 +1,40 @@
+"""Integer bit manipulation: population count, index iteration, reversal."""
+
+import random
+
+from bitsets import integers
+
+
+def random_int(size, density=0.5, *, seed=42) -> int:
+    rng = random.Random(seed)
+    return sum(1 << i for i in range(size) if rng.random() < density)
+
+
+def bench_count_bin(size):
+    n = random_int(size)
+    return lambda: bin(n).count('1')
+
+
+def bench_bit_count(size):
+    n = random_int(size)
+    return lambda: integers.bit_count(n)
+
+
+def bench_indexes_optimized(size, density):
+    n = random_int(size, density)
+    return lambda: list(integers.indexes_optimized(n))
+
+
+def bench_indexes_auto(size, density):
+    n = random_int(size, density)
+    return lambda: list(integers.indexes_auto(n))
+
+
+def bench_reinverted(size):
+    n = random_int(size)
+    return lambda: integers.reinverted(n, size)
+
+
+def bench_reinverted_optimized(size):
+    n = random_int(size)
+    return lambda: integers.reinverted_optimized(n, size)
@@ -0,0 +1,144 @@
+"""Bitset sequences: bulk construction, reduction, and sorting."""
+
+import pickle
+import random
+
+import bitsets
+
+SIZES = [64, 2_000]
+
+ROWS = 1_000
+
+
+def make_class(size):
+    return bitsets.bitset(f'Bench{size}', tuple(range(size)), list=True)
+
+
+def random_bools(size, density=0.5, *, rows=ROWS, seed=42):
+    rng = random.Random(seed)
+    return [[rng.random() < density for _ in range(size)] for _ in range(rows)]
+
+
+def bench_frombools_rowwise(size, density):
+    cls, bools = make_class(size), random_bools(size, density)
+    return lambda: cls.List.frombitsets(map(cls.frombools, bools))
+
+
+def bench_frombools(size, density):
+    cls, bools = make_class(size), random_bools(size, density)
+    return lambda: cls.List.frombools(bools)
+
+
+def bench_fromindexes(size, density):
+    cls, bools = make_class(size), random_bools(size, density)
+    indexes = [[i for i, b in enumerate(row) if b] for row in bools]
+    return lambda: cls.List.fromindexes(indexes)
+
+
+def bench_reduce_or(size):
+    cls, bools = make_class(size), random_bools(size, 0.0001)
+    series = cls.List.frombools(bools)
+    return lambda: series.reduce_or()
+
+
+def bench_stream_or_buffers(size):
+    cls, bools = make_class(size), random_bools(size, 0.0001)
+    data = cls.List.frombools(bools).tobytes()
+    return lambda: cls.stream_or([data], buffers=True)
+
+
+def bench_sort_key_shortlex(size):
+    cls, bools = make_class(size), random_bools(size)
+    series = cls.List.frombools(bools)
+    return lambda: sorted(series, key=cls.shortlex)
+
+
+def bench_sorted_shortlex(size):
+    cls, bools = make_class(size), random_bools(size)
+    series = cls.List.frombools(bools)
+    return lambda: series.sorted('shortlex')
+
+
+def bench_where_rowwise(size):
+    cls, bools = make_class(size), random_bools(size)
+    series = cls.List.frombools(bools)
+    return lambda: [i for i, b in enumerate(series) if 0 in b and 1 in b and 2 not in b]
+
+
+def bench_where(size):
+    cls, bools = make_class(size), random_bools(size)
+    series = cls.List.frombools(bools)
+    return lambda: series.where((0, 1), (2,))
+
+
+def bench_where_columns(size):
+    cls, bools = make_class(size), random_bools(size)
+    series = cls.List.frombools(bools)
+    columns = series.columns()
+    return lambda: series.where((0, 1), (2,), columns)
+
+
+def bench_columns(size):
+    cls, bools = make_class(size), random_bools(size)
+    series = cls.List.frombools(bools)
+    return lambda: series.columns()
+
+
+def bench_bits_rowwise(size):
+    cls = make_class(size)
+    series = cls.List.frombools(random_bools(size))
+    return lambda: '\n'.join(series.bits())
+
+
+def bench_encode_bits(size):
+    cls = make_class(size)
+    series = cls.List.frombools(random_bools(size))
+    return lambda: series.encode('bits')
+
+
+def bench_encode_hex(size):
+    cls = make_class(size)
+    series = cls.List.frombools(random_bools(size))
+    return lambda: series.encode('hex')
+
+
+def bench_frombits_rowwise(size):
+    cls = make_class(size)
+    text = cls.List.frombools(random_bools(size)).encode('bits')
+    return lambda: cls.List.frombits(text.split('\n'))
+
+
+def bench_decode_bits(size):
+    cls = make_class(size)
+    text = cls.List.frombools(random_bools(size)).encode('bits')
+    return lambda: cls.List.decode(text, 'bits')
+
+
+def bench_decode_hex(size):
+    cls = make_class(size)
+    text = cls.List.frombools(random_bools(size)).encode('hex')
+    return lambda: cls.List.decode(text, 'hex')
+
+
+def bench_pickle_dumps_rowwise(size):
+    cls = make_class(size)
+    bitsets = list(cls.List.frombools(random_bools(size)))  # pickled element-wise
+    return lambda: pickle.dumps(bitsets, pickle.HIGHEST_PROTOCOL)
+
+
+def bench_pickle_dumps(size):
+    cls = make_class(size)
+    series = cls.List.frombools(random_bools(size))
+    return lambda: pickle.dumps(series, pickle.HIGHEST_PROTOCOL)
+
+
+def bench_pickle_loads_rowwise(size):
+    cls = make_class(size)
+    data = pickle.dumps(list(cls.List.frombools(random_bools(size))), pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(data)
+
+
+def bench_pickle_loads(size):
+    cls = make_class(size)
+    data = pickle.dumps(cls.List.frombools(random_bools(size)), pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(data)
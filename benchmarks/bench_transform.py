@@ -0,0 +1,57 @@
+"""Conversion between integers and chunks of smaller integers and booleans."""
+
+import collections
+import random
+
+from bitsets import transform
+
+
+def random_bools(size, density=0.5, *, seed=42):
+    rng = random.Random(seed)
+    return [rng.random() < density for _ in range(size)]
+
+
+def bench_packbools(size, density):
+    bools = random_bools(size, density)
+    return lambda: collections.deque(transform.packbools(bools, 'B'), maxlen=0)
+
+
+def bench_packbytes(size, density):
+    bools = bytes(random_bools(size, density))
+    return lambda: transform.packbytes(bools)
+
+
+def bench_unpackbools(size, density):
+    chunks = list(transform.packbools(random_bools(size, density), 'B'))
+    return lambda: collections.deque(transform.unpackbools(chunks, 'B'), maxlen=0)
+
+
+def bench_boolbytes(size, density):
+    bools = random_bools(size, density)
+    return lambda: transform.boolbytes(bools)
+
+
+def bench_chunkreverse(size):
+    chunks = list(transform.packbools(random_bools(size), 'L'))
+    return lambda: collections.deque(transform.chunkreverse(chunks, 'L'), maxlen=0)
+
+
+def bench_transpose(size):
+    rng = random.Random(42)
+    rows = [rng.getrandbits(size) for _ in range(1_000)]
+    return lambda: transform.transpose(rows, size)
+
+
+def bench_packarray(size, density):
+    bools = random_bools(size, density)
+    return lambda: transform.packarray(bools, 'B')
+
+
+def bench_unpackarray(size, density):
+    chunks = transform.packarray(random_bools(size, density), 'B')
+    return lambda: transform.unpackarray(chunks, 'B')
+
+
+def bench_reversearray(size):
+    chunks = transform.packarray(random_bools(size), 'L')
+    return lambda: transform.reversearray(chunks, 'L')
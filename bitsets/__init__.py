@@ -16,7 +16,7 @@ __copyright__ = 'Copyright (c) 2013-2025 Sebastian Bank'
 
 
 def bitset(name: str, members, base=bases.BitSet,
-           list: bool = False, tuple: bool = False):
+           list: bool = False, tuple: bool = False, array: bool = False):
     """Return a new bitset class with given name and members.
 
     Args:
@@ -25,6 +25,7 @@ def bitset(name: str, members, base=bases.BitSet,
         base: Base class to derive the returned class from.
         list: Include a custom class for bitset lists.
         tuple: Include a custom class for bitset tuples.
+        array: Include a custom class for compact bitset arrays.
 
     Example:
         >>> Letters = bitset('Letters', 'abcdef', list=True, tuple=True)
@@ -42,7 +43,8 @@ def bitset(name: str, members, base=bases.BitSet,
     if not len(members):
         raise ValueError(f'less than one bitset member: {members!r}')
 
-    if len(set(members)) != len(members):
+    hash(members)  # TypeError if unhashable (members identify classes for unpickling)
+    if not isinstance(members, range) and len(set(members)) != len(members):
         raise ValueError(f'bitset members contains duplicates: {members!r}')
 
     if not issubclass(base.__class__, meta.MemberBitsMeta):
@@ -50,5 +52,9 @@ def bitset(name: str, members, base=bases.BitSet,
 
     listcls = {False: None, True: series.List}.get(list, list)
     tuplecls = {False: None, True: series.Tuple}.get(tuple, tuple)
+    arraycls = {False: None, True: series.Array}.get(array, array)
+    if arraycls is not None and not issubclass(base, int):
+        raise ValueError(f'array needs integer bitset rows, not base: {base!r}')
 
-    return base._make_subclass(name, members, listcls=listcls, tuplecls=tuplecls)
+    return base._make_subclass(name, members, listcls=listcls, tuplecls=tuplecls,
+                               arraycls=arraycls)
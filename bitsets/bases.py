@@ -1,15 +1,42 @@
 """Base classes for bitsets providing integer-like and set-like interface."""
 
-from itertools import compress, filterfalse
+import builtins
+from collections.abc import Sequence
+from functools import lru_cache, partial, reduce
+from itertools import islice, repeat
+import operator
 
 from . import combos
 from . import integers
 from . import meta
+from . import transform
 
-__all__ = ['MemberBits', 'BitSet']
+__all__ = ['MemberBits', 'BitSet', 'BitSetBuilder']
 
 __new__ = int.__new__
 
+MEMBERS_CACHE = 1_024
+
+INTERN_CACHE = 65_536
+
+
+def _interned(cls, maxsize: int | None):
+    """Return fromint classmethod function sharing instances of cls with equal value (LRU)."""
+    new = lru_cache(maxsize)(partial(int.__new__, cls))
+
+    def fromint(owner, *args):
+        if owner is not cls:  # subclass of the interned class
+            return int.__new__(owner, *args)
+        return new(int(*args))
+
+    vars(fromint).update(cache_info=new.cache_info, cache_clear=new.cache_clear)
+    return fromint
+
+
+def _builder(cls, data: bytes):
+    """Return a builder of bitset class cls from little-endian bytes (unpickling)."""
+    return cls.Builder(cls.frombytes(data))
+
 
 class MemberBits(int, metaclass=meta.MemberBitsMeta):
     """Subsets of a predefined domain as rank in colexicographical order.
@@ -18,21 +45,102 @@ class MemberBits(int, metaclass=meta.MemberBitsMeta):
         bits: String with the binary membership representation.
     """
 
-    _indexes = integers.indexes_optimized
+    _members: Sequence  # no value: abstract bases have no domain (see meta)
+
+    _len: int
+
+    _nbytes: int
+
+    _indexes = integers.indexes_auto
 
-    _reinverted = integers.reinverted
+    _reinverted = integers.reinverted_optimized
+
+    _bit_count = integers.bit_count
+
+    @meta.cached_classproperty
+    def _atoms(cls):  # noqa: N805
+        """Singleton set for every domain index."""
+        if cls._len > meta.EAGER_ATOMS:
+            return meta.Atoms(cls)
+        return tuple(map(cls.fromint, map(operator.lshift, repeat(1), range(cls._len))))
+
+    @meta.cached_classproperty
+    def _map(cls):  # noqa: N805
+        """Singleton set for every domain member."""
+        if cls._len > meta.EAGER_ATOMS:
+            return meta.AtomMap(cls)
+        return dict(zip(cls._members, cls._atoms))
+
+    @meta.cached_classproperty
+    def _index(cls):  # noqa: N805
+        """Domain index for every domain member."""
+        return meta.member_index(cls._members)
+
+    @meta.cached_classproperty
+    def supremum(cls):  # noqa: N805
+        """The set of all domain members."""
+        return cls.fromint(integers.bit_mask(cls._len))  # all ones
+
+    @meta.cached_classproperty
+    def Builder(cls):  # noqa: N802,N805
+        """Mutable companion class for incremental construction (see ``BitSetBuilder``)."""
+        return type(f'{cls.__name__}Builder', (BitSetBuilder,),
+                    {'__slots__': (), 'BitSet': cls})
+
+    @meta.cached_classproperty
+    def frommembers_cached(cls):  # noqa: N805
+        """``frommembers()`` with LRU cache for tuples and frozensets (``cache_info()``)."""
+        return lru_cache(maxsize=MEMBERS_CACHE)(cls.frommembers)
 
     frombitset = fromint = classmethod(int.__new__)
 
+    @classmethod
+    def intern(cls, maxsize: int | None = INTERN_CACHE) -> None:
+        """Share the instances of equal sets created via ``fromint()``.
+
+        Args:
+            maxsize: Size of the LRU cache of instances (``None``: unbounded,
+                     ``0``: stop interning).
+
+        >>> Interned = MemberBits._make_subclass('Interned', 'abc')
+        >>> Interned.intern(16)
+        >>> Interned('011') is Interned.fromint(6)
+        True
+        >>> Interned.fromint.cache_info().hits
+        1
+        >>> Interned.intern(0)
+        >>> Interned('011') is Interned.fromint(6)
+        False
+        """
+        if not hasattr(cls, '_members'):
+            raise RuntimeError(f'{cls!r} attempt intern')
+        for name in ('fromint', 'frombitset'):
+            method = vars(cls).get(name)
+            if isinstance(method, classmethod) and hasattr(method.__func__, 'cache_info'):
+                delattr(cls, name)  # installed by intern()
+        if maxsize != 0:  # bounded (no WeakValueDictionary: int subclasses lack __weakref__)
+            fromint: classmethod = classmethod(_interned(cls, maxsize))
+            for name in ('fromint', 'frombitset'):
+                setattr(cls, name, fromint)
+
     @classmethod
     def frommembers(cls, members=()):
         """Create a set from an iterable of members."""
-        return cls.fromint(sum(map(cls._map.__getitem__, set(members))))
+        if isinstance(cls._map, dict):  # OR cached singletons (no set, no sum)
+            return cls.fromint(reduce(operator.or_, map(cls._map.__getitem__, members), 0))
+        if isinstance(cls._index, meta.RangeIndex):
+            indexes = cls._index.indexes(members)
+        else:
+            indexes = list(map(cls._index.__getitem__, members))
+        return cls.fromint(integers.n_auto(indexes, cls._len))
 
     @classmethod
     def frombools(cls, bools=()):
         """Create a set from an iterable of boolean evaluable items."""
-        return cls.fromint(sum(compress(cls._atoms, bools)))
+        if not hasattr(bools, '__len__'):
+            bools = islice(bools, cls._len)
+        bits = transform.boolbytes(bools)[:cls._len].translate(transform.BOOLCHARS)
+        return cls.fromint(bits[::-1] or b'0', 2)
 
     @classmethod
     def frombits(cls, bits='0'):
@@ -41,6 +149,14 @@ class MemberBits(int, metaclass=meta.MemberBitsMeta):
             raise ValueError(f'too many bits {bits!r}')
         return cls.fromint(bits[::-1], 2)
 
+    @classmethod
+    def frombytes(cls, data):
+        """Create a set from little-endian bytes (e.g. from ``tobytes()``)."""
+        n = int.from_bytes(data, 'little')
+        if n >> cls._len:
+            raise ValueError(f'too many bits {bytes(data)!r}')
+        return cls.fromint(n)
+
     __new__ = frombits.__func__
 
     def __reduce__(self):
@@ -52,7 +168,9 @@ class MemberBits(int, metaclass=meta.MemberBitsMeta):
 
     int = _int = int.real
 
-    iter_set = integers.indexes
+    def iter_set(self):
+        """Yield the domain index of every set member."""
+        return self._indexes()
 
     def members(self, as_set=False):
         """Return the set members tuple/frozenset."""
@@ -62,24 +180,35 @@ class MemberBits(int, metaclass=meta.MemberBitsMeta):
 
     def bools(self) -> tuple[bool, ...]:
         """Return the boolean sequence of set membership."""
-        return tuple(not not self & a for a in self._atoms)
+        return tuple(map('1'.__eq__, self.bits()))
 
     def bits(self) -> str:
         """Return the binary string of set membership."""
         return '{0:0{1}b}'.format(self, self._len)[::-1]
 
+    def tobytes(self) -> bytes:
+        """Return the little-endian bytes of set membership."""
+        return self.to_bytes(self._nbytes, 'little')
+
+    def __buffer__(self, flags: builtins.int) -> memoryview:
+        return memoryview(self.tobytes())
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.bits()!r})'
 
     def atoms(self, reverse=False):
         """Yield the singleton for every set member."""
-        atoms = reversed(self._atoms) if reverse else self._atoms
-        return filter(self.__and__, atoms)
+        indexes = self._indexes()
+        if reverse:
+            indexes = reversed(tuple(indexes))
+        return map(self._atoms.__getitem__, indexes)
 
     def inatoms(self, reverse=False):
         """Yield the singleton for every non-member."""
-        atoms = reversed(self._atoms) if reverse else self._atoms
-        return filterfalse(self.__and__, atoms)
+        indexes = self.__class__._indexes(self ^ self.supremum)
+        if reverse:
+            indexes = reversed(tuple(indexes))
+        return map(self._atoms.__getitem__, indexes)
 
     def powerset(self, start=None, excludestart=False):
         """Yield combinations from start to self in short lexicographic order."""
@@ -90,29 +219,54 @@ class MemberBits(int, metaclass=meta.MemberBitsMeta):
             if self | start != self:
                 raise ValueError(f'{start!r} is no subset of {self!r}')
             other = self.fromint(self & ~start).atoms()
-        return map(self.frombitset, combos.shortlex(start, list(other)))
+        return map(self.frombitset,
+                   combos.shortlex_atoms(start, tuple(other), excludestart))
+
+    @classmethod
+    def fromshortlex(cls, index: builtins.int):
+        """Create the set with the given rank in short lexicographical order."""
+        return cls.fromint(integers.unrank_shortlex(index, cls._len))
+
+    @classmethod
+    def fromcombination(cls, index: builtins.int, k: builtins.int):
+        """Create the k-member set with the given lexicographical rank."""
+        return cls.fromint(integers.unrank_combination(index, k, cls._len))
+
+    @classmethod
+    def powerset_range(cls, start: builtins.int, stop: builtins.int):
+        """Yield the sets with rank in range(start, stop) in short lexicographical order."""
+        return map(cls.frombitset, combos.shortlex_range(cls._atoms, start, stop))
+
+    def shortlex_rank(self) -> builtins.int:
+        """Return the rank of the set in short lexicographical order."""
+        return integers.rank_shortlex(self, self._len)
+
+    def combination_rank(self) -> builtins.int:
+        """Return the lexicographical rank among the sets of equal cardinality."""
+        return integers.rank_combination(self, self._len)
 
     def shortlex(self):
         """Return sort key for short lexicographical order."""
-        return bin(self).count('1'), self._reinverted(self._len)
+        return self._bit_count(), self._reinverted(self._len)
 
     def longlex(self):
         """Return sort key for long lexicographical order."""
-        return -bin(self).count('1'), self._reinverted(self._len)
+        return -self._bit_count(), self._reinverted(self._len)
 
     def shortcolex(self):
         """Return sort key for short colexicographical order."""
-        return bin(self).count('1'), self._int
+        return self._bit_count(), self._int
 
     def longcolex(self):
         """Return sort key for long colexicographical order."""
-        return -bin(self).count('1'), self._int
+        return -self._bit_count(), self._int
 
-    def count(self, value: bool = True) -> int:
+    def count(self, value: bool = True) -> builtins.int:
         """Returns the number of present/absent members."""
         if value not in (True, False):
             raise ValueError(f'can only count True or False, not {value!r}')
-        return bin(self)[2:].count('01'[value])
+        count = self._bit_count()
+        return count if value else self._len - count
 
     def all(self) -> bool:
         """Return True iff the set contains all domain items."""
@@ -138,7 +292,7 @@ class BitSet(MemberBits):
 
     def __len__(self) -> int:
         """Return the number of items in the set (cardinality)."""
-        return bin(self).count('1')
+        return self._bit_count()
 
     def __iter__(self):
         """Iterate over the set members."""
@@ -150,55 +304,188 @@ class BitSet(MemberBits):
         Raises:
             KeyError: if member is not in the domain of the set.
         """
-        return self._map[member] & self
+        if isinstance(self._map, dict):  # cached singletons (small domains)
+            return self._map[member] & self
+        i = self._index[member]  # no singleton via fromint() (copy of domain size)
+        if i << 2 > self._len * 3:  # shift is O(len - i), mask O(i) but cheaper per bit
+            return self >> i & 1
+        return self & 1 << i
 
     def __repr__(self) -> str:
         members = list(map(self._members.__getitem__, self._indexes()))
         arg = repr(members) if members else ''
         return f'{self.__class__.__name__}({arg})'
 
+    @classmethod
+    def _frommembers(cls, members):
+        """``frommembers()`` using ``frommembers_cached()`` for tuples and frozensets."""
+        if type(members) in (tuple, frozenset):
+            return cls.frommembers_cached(members)
+        return cls.frommembers(members)
+
     def issubset(self, other) -> bool:
         """Inverse set containment."""
         if not isinstance(other, self.__class__):
-            other = self.frommembers(other)
+            other = self._frommembers(other)
         return self & other == self
 
     def issuperset(self, other) -> bool:
         """Set containment."""
         if not isinstance(other, self.__class__):
-            other = self.frommembers(other)
+            other = self._frommembers(other)
         return self | other == self
 
     def isdisjoint(self, other) -> bool:
         """Set disjointness."""
         if not isinstance(other, self.__class__):
-            other = self.frommembers(other)
+            other = self._frommembers(other)
         return not self & other
 
-    def intersection(self, other):
-        """Set intersection."""
-        if not isinstance(other, self.__class__):
-            other = self.frommembers(other)
-        return self.frombitset(self & other)
-
-    def union(self, other):
-        """Set union."""
-        if not isinstance(other, self.__class__):
-            other = self.frommembers(other)
-        return self.frombitset(self | other)
-
-    def difference(self, other):
-        """Set difference."""
-        if not isinstance(other, self.__class__):
-            other = self.frommembers(other)
-        return self.frombitset(self & ~other)
+    def intersection(self, *others):
+        """Set intersection (of all others)."""
+        result = self._int
+        for other in others:
+            if not isinstance(other, self.__class__):
+                other = self._frommembers(other)
+            result &= other
+        return self.frombitset(result)
+
+    def union(self, *others):
+        """Set union (of all others)."""
+        result = self._int
+        for other in others:
+            if not isinstance(other, self.__class__):
+                other = self._frommembers(other)
+            result |= other
+        return self.frombitset(result)
+
+    def difference(self, *others):
+        """Set difference (from all others)."""
+        result = self._int
+        for other in others:
+            if not isinstance(other, self.__class__):
+                other = self._frommembers(other)
+            result &= ~other
+        return self.frombitset(result)
 
     def symmetric_difference(self, other):
         """Symmetric set difference."""
         if not isinstance(other, self.__class__):
-            other = self.frommembers(other)
+            other = self._frommembers(other)
         return self.frombitset(self ^ other)
 
     def complement(self):
         """Complement set."""
         return self.frombitset(self ^ self.supremum)
+
+
+class BitSetBuilder:
+    """Mutable set of domain members for building a bitset in place.
+
+    Args:
+        members: Iterable of domain members or set (of class ``BitSet``).
+    Raises:
+        KeyError: if a member is not in the domain of the set.
+
+    Stores the membership as little-endian ``bytearray`` so that ``add()``
+    and ``discard()`` change one byte instead of allocating a new integer.
+    Use ``freeze()`` to convert into an (immutable) ``BitSet`` instance.
+    """
+
+    __slots__ = ('_data',)
+
+    BitSet: type[MemberBits]
+
+    def __init__(self, members=()) -> None:
+        if not isinstance(members, self.BitSet):
+            members = self.BitSet.frommembers(members)
+        self._data = bytearray(members.tobytes())
+
+    def __reduce__(self):
+        return _builder, (self.BitSet, bytes(self._data))
+
+    def freeze(self):
+        """Return the immutable set of the current members."""
+        return self.BitSet.fromint(int.from_bytes(self._data, 'little'))
+
+    def copy(self):
+        """Return a new builder with the current members."""
+        return self.__class__(self.freeze())
+
+    def add(self, member) -> None:
+        """Add member to the set."""
+        i = self.BitSet._index[member]
+        self._data[i >> 3] |= 1 << (i & 7)
+
+    def discard(self, member) -> None:
+        """Remove member from the set if present."""
+        i = self.BitSet._index[member]
+        self._data[i >> 3] &= ~(1 << (i & 7))
+
+    def remove(self, member) -> None:
+        """Remove member from the set.
+
+        Raises:
+            KeyError: if member is not present.
+        """
+        if member not in self:
+            raise KeyError(member)
+        self.discard(member)
+
+    def clear(self) -> None:
+        """Remove all members from the set."""
+        self._data[:] = bytes(len(self._data))
+
+    def update(self, members) -> None:
+        """Add all members from the iterable to the set."""
+        data = self._data
+        for i in map(self.BitSet._index.__getitem__, members):
+            data[i >> 3] |= 1 << (i & 7)
+
+    def __contains__(self, member) -> bool:
+        """Set membership.
+
+        Raises:
+            KeyError: if member is not in the domain of the set.
+        """
+        i = self.BitSet._index[member]
+        return bool(self._data[i >> 3] >> (i & 7) & 1)
+
+    def __len__(self) -> int:
+        return integers.bit_count(int.from_bytes(self._data, 'little'))
+
+    def __iter__(self):
+        return iter(self.freeze().members())
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self._data == other._data
+        if isinstance(other, self.BitSet):
+            return self.freeze() == other
+        return NotImplemented  # __eq__ without __hash__: unhashable (mutable)
+
+    def __repr__(self) -> str:
+        members = list(self)
+        arg = repr(members) if members else ''
+        return f'{self.__class__.__name__}({arg})'
+
+    def _inplace(self, other, op):
+        if isinstance(other, BitSetBuilder) and other.BitSet is self.BitSet:
+            other = other.freeze()
+        elif not isinstance(other, self.BitSet):
+            return NotImplemented
+        n = op(int.from_bytes(self._data, 'little'), other)
+        self._data[:] = n.to_bytes(len(self._data), 'little')
+        return self
+
+    def __ior__(self, other):
+        return self._inplace(other, operator.or_)
+
+    def __iand__(self, other):
+        return self._inplace(other, operator.and_)
+
+    def __ixor__(self, other):
+        return self._inplace(other, operator.xor)
+
+    def __isub__(self, other):
+        return self._inplace(other, lambda n, other: n & ~other)
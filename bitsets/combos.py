@@ -1,8 +1,11 @@
 """Powerset generators based on combining integers or sets."""
 
-import collections
+from itertools import chain, combinations, repeat
+import operator
 
-__all__ = ['shortlex', 'reverse_shortlex']
+from . import integers
+
+__all__ = ['shortlex', 'shortlex_atoms', 'shortlex_range', 'reverse_shortlex']
 
 
 def shortlex(start, other, excludestart: bool = False):
@@ -18,22 +21,89 @@ def shortlex(start, other, excludestart: bool = False):
     >>> assert list(shortlex(set(), [{1}, {2}], excludestart=True)) == \
         [{1}, {2}, {1, 2}]
     """
+    other = tuple(other)
     if not excludestart:
         yield start
 
-    queue = collections.deque([(start, other)])
+    for r in range(1, len(other) + 1):
+        yield from _combined(start, other, r, operator.or_)
+
+
+def _combined(start, other, r: int, op):
+    """Yield start combined by op with the r-combinations of other.
+
+    Lexicographic order of ``itertools.combinations()``, keeping the partial
+    results of the current prefix (O(r) memory) and recombining them only
+    from the first position that changed.
+
+    >>> ['{:03b}'.format(s) for s in _combined(0, (0b100, 0b010, 0b001), 2, operator.or_)]
+    ['110', '101', '011']
+    """
+    last = r - 1
+    n = len(other)
+    indexes = list(range(last))
+    partial = [start]
+    for x in other[:last]:
+        partial.append(op(partial[-1], x))
+
+    while True:
+        value = partial[last]
+        for x in other[indexes[-1] + 1 if last else 0:]:
+            yield op(value, x)
+
+        i = last - 1  # lexicographical successor of the prefix
+        while i >= 0 and indexes[i] == n - r + i:
+            i -= 1
+        if i < 0:
+            return
+        j = indexes[i]
+        for p in range(i, last):
+            j += 1
+            indexes[p] = j
+            partial[p + 1] = op(partial[p], other[j])
+
+
+def shortlex_atoms(start: int, atoms, excludestart: bool = False):
+    """Yield all unions of start with disjoint atoms in shortlex order.
+
+    >>> ['{:03b}'.format(s) for s in shortlex_atoms(0, [0b100, 0b010, 0b001])]
+    ['000', '100', '010', '001', '110', '101', '011', '111']
+
+    >>> ['{:04b}'.format(s) for s in shortlex_atoms(0b1, [0b100, 0b010], True)]
+    ['0101', '0011', '0111']
+    """
+    return chain.from_iterable(map(sum, combinations(atoms, r), repeat(start))
+                               for r in range(1 if excludestart else 0,
+                                              len(atoms) + 1))
 
-    while queue:
-        (current, other) = queue.popleft()
 
-        while other:
-            (first, other) = other[0], other[1:]
-            result = current | first
+def shortlex_range(atoms, start: int, stop: int):
+    """Yield the sums of atoms combinations with shortlex rank in range(start, stop).
 
-            yield result
+    >>> ['{:03b}'.format(s) for s in shortlex_range([0b100, 0b010, 0b001], 2, 6)]
+    ['010', '001', '110', '101']
 
-            if other:
-                queue.append((result, other))
+    >>> ['{:03b}'.format(s) for s in shortlex_range([0b100, 0b010, 0b001], 6, 99)]
+    ['011', '111']
+    """
+    r = len(atoms)
+    stop = min(stop, 1 << r)
+    if start >= stop:
+        return
+
+    indexes = list(integers.indexes_auto(integers.unrank_shortlex(start, r)))
+    k = len(indexes)
+    for _ in range(stop - start):
+        yield sum(map(atoms.__getitem__, indexes))
+
+        i = k - 1  # lexicographical successor
+        while i >= 0 and indexes[i] == r - k + i:
+            i -= 1
+        if i < 0:
+            k += 1
+            indexes = list(range(k))
+        else:
+            indexes[i:] = range(indexes[i] + 1, indexes[i] + 1 + k - i)
 
 
 def reverse_shortlex(end, other, excludeend: bool = False):
@@ -50,19 +120,9 @@ def reverse_shortlex(end, other, excludeend: bool = False):
     >>> assert list(reverse_shortlex({1, 2}, [{1}, {2}], excludeend=True)) == \
         [{1}, {2}, set()]
     """
+    other = tuple(other)
     if not excludeend:
         yield end
 
-    queue = collections.deque([(end, other)])
-
-    while queue:
-        (current, other) = queue.popleft()
-
-        while other:
-            (first, other) = other[0], other[1:]
-            result = current & first
-
-            yield result
-
-            if other:
-                queue.append((result, other))
+    for r in range(1, len(other) + 1):
+        yield from _combined(end, other, r, operator.and_)
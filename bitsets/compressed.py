@@ -0,0 +1,511 @@
+"""Compressed (roaring-style) bitsets for large sparse domains.
+
+The domain indexes are split into chunks of ``CHUNK`` (high 16 bits as key).
+Only non-empty chunks are stored, each in the smallest of three containers:
+
+- sorted ``array.array('H')`` of the low 16 bits (array container)
+- integer of up to ``CHUNK`` bits (bitmap container)
+- tuple of ``range`` objects of consecutive low 16 bits (run container)
+
+The container kind is a function of the chunk content, so equal sets have
+equal representations.
+"""
+
+import array
+import builtins
+from bisect import bisect_left
+from collections import deque
+from functools import reduce
+from itertools import chain, compress, repeat
+import operator
+
+from . import combos
+from . import integers
+from . import meta
+from . import transform
+
+__all__ = ['CompressedBitSet']
+
+CHUNK = 1 << 16
+
+ARRAY_MAX = 4_096  # array container cardinality limit (same size as bitmap)
+
+BITMAP_SIZE = CHUNK // 8
+
+SETOPS = {'and': operator.and_, 'or': operator.or_,
+          'xor': operator.xor, 'sub': operator.sub}
+
+INTOPS = {'and': operator.and_, 'or': operator.or_,
+          'xor': operator.xor, 'sub': lambda a, b: a & ~b}
+
+
+def _fromvalues(values):
+    """Return the container for a sorted sequence of low bits (None if empty)."""
+    if not values:
+        return None
+    card = len(values)
+    gaps = list(map(operator.ne, values[1:], map(operator.add, values, repeat(1))))
+    nruns = 1 + sum(gaps)
+    if nruns * 4 < min(card * 2, BITMAP_SIZE):
+        starts = chain(values[:1], compress(values[1:], gaps))
+        stops = chain(compress(values, gaps), values[-1:])
+        return tuple(map(range, starts, map(operator.add, stops, repeat(1))))
+    if card <= ARRAY_MAX:
+        return array.array('H', values)
+    return _toint(array.array('H', values))
+
+
+def _fromint(n: int):
+    """Return the container for an integer of low bits (None if zero)."""
+    if not n:
+        return None
+    card = integers.bit_count(n)
+    starts = n & ~(n << 1)
+    nruns = integers.bit_count(starts)
+    if nruns * 4 < min(card * 2, BITMAP_SIZE):
+        stops = n & ~(n >> 1)
+        return tuple(map(range, integers.indexes_auto(starts),
+                         map(operator.add, integers.indexes_auto(stops), repeat(1))))
+    if card <= ARRAY_MAX:
+        return array.array('H', integers.indexes_auto(n))
+    return n
+
+
+def _toint(container) -> int:
+    if isinstance(container, int):
+        return container
+    if isinstance(container, tuple):
+        return sum((1 << r.stop) - (1 << r.start) for r in container)
+    bools = bytearray(container[-1] + 1)
+    deque(map(bools.__setitem__, container, repeat(1)), maxlen=0)
+    return int(bools.translate(transform.BOOLCHARS)[::-1], 2)
+
+
+def _values(container):
+    """Return an iterable over the sorted low bits of container."""
+    if isinstance(container, int):
+        return integers.indexes_auto(container)
+    if isinstance(container, tuple):
+        return chain.from_iterable(container)
+    return container
+
+
+def _len(container) -> int:
+    if isinstance(container, int):
+        return integers.bit_count(container)
+    if isinstance(container, tuple):
+        return sum(map(len, container))
+    return len(container)
+
+
+def _contains(container, low: int) -> bool:
+    if isinstance(container, int):
+        return bool(container >> low & 1)
+    if isinstance(container, tuple):
+        return any(low in r for r in container)
+    i = bisect_left(container, low)
+    return i < len(container) and container[i] == low
+
+
+def _combine(op: str, a, b):
+    if isinstance(a, array.array) and isinstance(b, array.array):
+        return _fromvalues(sorted(SETOPS[op](set(a), set(b))))
+    if op == 'and' and isinstance(b, array.array):
+        a, b = b, a
+    if op == 'and' and isinstance(a, array.array):
+        return _fromvalues([v for v in a if _contains(b, v)])
+    return _fromint(INTOPS[op](_toint(a), _toint(b)))
+
+
+def _hashable(container):
+    return container.tobytes() if isinstance(container, array.array) else container
+
+
+class Atoms(meta.Atoms):
+    """Singleton sets of a compressed bitset class by domain index computed on demand."""
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        indexes = range(self._cls._len)[index]
+        if isinstance(index, slice):
+            return tuple(map(self.__getitem__, indexes))
+        return self._cls._fromindexes([indexes])  # one array container
+
+
+class CompressedBitSet(metaclass=meta.MemberBitsMeta):
+    """Ordered container of unique elements from a large predefined domain.
+
+    Args:
+        members: Iterable of domain members.
+    Raises:
+        KeyError: if a member is not in the domain of the set.
+
+    Stores the set in chunk containers (see ``bitsets.compressed``) instead
+    of an integer of domain size. Provides the set API and conversions of
+    ``BitSet`` (use ``int`` for the integer rank).
+    """
+
+    __slots__ = ('_keys', '_containers')
+
+    _members: tuple
+
+    _len: int
+
+    _nbytes: int
+
+    _keys: tuple[int, ...]
+
+    _containers: tuple
+
+    @meta.cached_classproperty
+    def _atoms(cls):  # noqa: N805
+        """Singleton set for every domain index (computed on demand)."""
+        return Atoms(cls)
+
+    @meta.cached_classproperty
+    def _index(cls):  # noqa: N805
+        """Domain index for every domain member."""
+        return meta.member_index(cls._members)
+
+    @meta.cached_classproperty
+    def supremum(cls):  # noqa: N805
+        """The set of all domain members (full run chunks)."""
+        keys = range((cls._len + CHUNK - 1) // CHUNK)
+        return cls._fromchunks(keys, [_fromvalues(range(min(CHUNK, cls._len - k * CHUNK)))
+                                      for k in keys])
+
+    @classmethod
+    def _fromchunks(cls, keys, containers):
+        self = object.__new__(cls)
+        self._keys = tuple(keys)
+        self._containers = tuple(containers)
+        return self
+
+    @classmethod
+    def _fromindexes(cls, indexes):
+        """Create a set from a sorted list of unique domain indexes."""
+        keys, containers = [], []
+        start = 0
+        while start < len(indexes):
+            key = indexes[start] // CHUNK
+            stop = bisect_left(indexes, (key + 1) * CHUNK, start)
+            lows = map(operator.sub, indexes[start:stop], repeat(key * CHUNK))
+            keys.append(key)
+            containers.append(_fromvalues(list(lows)))
+            start = stop
+        return cls._fromchunks(keys, containers)
+
+    @classmethod
+    def frommembers(cls, members=()):
+        """Create a set from an iterable of members."""
+        return cls._fromindexes(sorted(set(map(cls._index.__getitem__, members))))
+
+    @classmethod
+    def frombools(cls, bools=()):
+        """Create a set from an iterable of boolean evaluable items."""
+        return cls._fromindexes(list(compress(range(cls._len), bools)))
+
+    @classmethod
+    def frombits(cls, bits='0'):
+        """Create a set from binary string."""
+        if len(bits) > cls._len:
+            raise ValueError(f'too many bits {bits!r}')
+        return cls.fromint(int(bits[::-1], 2))
+
+    @classmethod
+    def fromint(cls, n: int):
+        """Create a set from its integer rank."""
+        data = n.to_bytes((n.bit_length() + 7) // 8, 'little')
+        keys, containers = [], []
+        for key, i in enumerate(range(0, len(data), BITMAP_SIZE)):
+            container = _fromint(int.from_bytes(data[i:i + BITMAP_SIZE], 'little'))
+            if container is not None:
+                keys.append(key)
+                containers.append(container)
+        return cls._fromchunks(keys, containers)
+
+    @classmethod
+    def frombitset(cls, bitset):
+        """Return bitset as instance of cls (from instance or integer rank)."""
+        if isinstance(bitset, cls):
+            return bitset
+        return cls.fromint(bitset)
+
+    @classmethod
+    def frombytes(cls, data):
+        """Create a set from little-endian bytes (e.g. from ``tobytes()``)."""
+        n = int.from_bytes(data, 'little')
+        if n >> cls._len:
+            raise ValueError(f'too many bits {bytes(data)!r}')
+        return cls.fromint(n)
+
+    def __new__(cls, members=()):
+        return cls.frommembers(members)
+
+    def __reduce__(self):
+        return self.__class__._fromchunks, (self._keys, self._containers)
+
+    def copy(self):
+        """Return the set unchanged (as its is immutable)."""
+        return self
+
+    @property
+    def int(self) -> builtins.int:
+        """Integer rank of the set."""
+        return sum(_toint(c) << (k * CHUNK)
+                   for k, c in zip(self._keys, self._containers))
+
+    def __int__(self) -> builtins.int:
+        return self.int
+
+    def iter_set(self):
+        """Yield the domain index of every set member."""
+        for key, container in zip(self._keys, self._containers):
+            yield from map(operator.add, repeat(key * CHUNK), _values(container))
+
+    _indexes = iter_set  # see MemberBitsMeta.atomic()
+
+    def members(self, as_set=False):
+        """Return the set members tuple/frozenset."""
+        if as_set:
+            return frozenset(map(self._members.__getitem__, self.iter_set()))
+        return tuple(map(self._members.__getitem__, self.iter_set()))
+
+    def bools(self) -> tuple[bool, ...]:
+        """Return the boolean sequence of set membership."""
+        return tuple(map('1'.__eq__, self.bits()))
+
+    def bits(self) -> str:
+        """Return the binary string of set membership."""
+        return '{0:0{1}b}'.format(self.int, self._len)[::-1]
+
+    def tobytes(self) -> bytes:
+        """Return the little-endian bytes of set membership."""
+        return self.int.to_bytes(self._nbytes, 'little')
+
+    def __repr__(self) -> str:
+        members = list(self)
+        arg = repr(members) if members else ''
+        return f'{self.__class__.__name__}({arg})'
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return (self._keys == other._keys
+                and self._containers == other._containers)
+
+    def __lt__(self, other):  # integer rank order (like BitSet)
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.int < other.int
+
+    def __le__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.int <= other.int
+
+    def __gt__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.int > other.int
+
+    def __ge__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.int >= other.int
+
+    def __hash__(self) -> builtins.int:
+        return hash((self._keys, tuple(map(_hashable, self._containers))))
+
+    def __len__(self) -> builtins.int:
+        """Return the number of items in the set (cardinality)."""
+        return sum(map(_len, self._containers))
+
+    def __iter__(self):
+        """Iterate over the set members."""
+        return map(self._members.__getitem__, self.iter_set())
+
+    def __contains__(self, member) -> bool:
+        """Set membership.
+
+        Raises:
+            KeyError: if member is not in the domain of the set.
+        """
+        key, low = divmod(self._index[member], CHUNK)
+        i = bisect_left(self._keys, key)
+        return (i < len(self._keys) and self._keys[i] == key
+                and _contains(self._containers[i], low))
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def _combine(self, other, op: str):
+        left = dict(zip(self._keys, self._containers))
+        right = dict(zip(other._keys, other._containers))
+        if op == 'and':
+            keys = sorted(left.keys() & right.keys())
+        elif op == 'sub':
+            keys = list(left)
+        else:
+            keys = sorted(left.keys() | right.keys())
+
+        result_keys, containers = [], []
+        for key in keys:
+            a, b = left.get(key), right.get(key)
+            if b is None:
+                container = a
+            elif a is None:
+                container = None if op == 'sub' else b
+            else:
+                container = _combine(op, a, b)
+            if container is not None:
+                result_keys.append(key)
+                containers.append(container)
+        return self._fromchunks(result_keys, containers)
+
+    def __and__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._combine(other, 'and')
+
+    def __or__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._combine(other, 'or')
+
+    def __xor__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._combine(other, 'xor')
+
+    def __sub__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._combine(other, 'sub')
+
+    def shortlex(self):
+        """Return sort key for short lexicographical order."""
+        return len(self), integers.reinverted_optimized(self.int, self._len)
+
+    def longlex(self):
+        """Return sort key for long lexicographical order."""
+        return -len(self), integers.reinverted_optimized(self.int, self._len)
+
+    def shortcolex(self):
+        """Return sort key for short colexicographical order."""
+        return len(self), self.int
+
+    def longcolex(self):
+        """Return sort key for long colexicographical order."""
+        return -len(self), self.int
+
+    def atoms(self, reverse=False):
+        """Yield the singleton for every set member."""
+        indexes = self.iter_set()
+        if reverse:
+            indexes = reversed(tuple(indexes))
+        return map(self._atoms.__getitem__, indexes)
+
+    def inatoms(self, reverse=False):
+        """Yield the singleton for every non-member."""
+        indexes = (self.supremum - self).iter_set()
+        if reverse:
+            indexes = reversed(tuple(indexes))
+        return map(self._atoms.__getitem__, indexes)
+
+    def powerset(self, start=None, excludestart=False):
+        """Yield combinations from start to self in short lexicographic order."""
+        if start is None:
+            start = self.infimum
+            other = self.atoms()
+        else:
+            if self | start != self:
+                raise ValueError(f'{start!r} is no subset of {self!r}')
+            other = (self - start).atoms()
+        return combos.shortlex(start, tuple(other), excludestart)
+
+    @classmethod
+    def fromshortlex(cls, index: builtins.int):
+        """Create the set with the given rank in short lexicographical order."""
+        return cls.fromint(integers.unrank_shortlex(index, cls._len))
+
+    @classmethod
+    def fromcombination(cls, index: builtins.int, k: builtins.int):
+        """Create the k-member set with the given lexicographical rank."""
+        return cls.fromint(integers.unrank_combination(index, k, cls._len))
+
+    @classmethod
+    def powerset_range(cls, start: builtins.int, stop: builtins.int):
+        """Yield the sets with rank in range(start, stop) in short lexicographical order."""
+        return map(cls.fromshortlex, range(start, min(stop, 1 << cls._len)))
+
+    def shortlex_rank(self) -> builtins.int:
+        """Return the rank of the set in short lexicographical order."""
+        return integers.rank_shortlex(self.int, self._len)
+
+    def combination_rank(self) -> builtins.int:
+        """Return the lexicographical rank among the sets of equal cardinality."""
+        return integers.rank_combination(self.int, self._len)
+
+    def count(self, value: bool = True) -> builtins.int:
+        """Returns the number of present/absent members."""
+        if value not in (True, False):
+            raise ValueError(f'can only count True or False, not {value!r}')
+        count = len(self)
+        return count if value else self._len - count
+
+    def all(self) -> bool:
+        """Return True iff the set contains all domain items."""
+        return self == self.supremum
+
+    def any(self) -> bool:
+        """Return True iff the set contains at least one item."""
+        return bool(self._keys)
+
+    @classmethod
+    def _coerce(cls, other):
+        """Return other as set of cls."""
+        if isinstance(other, cls):
+            return other
+        return cls.frommembers(other)
+
+    def issubset(self, other) -> bool:
+        """Inverse set containment."""
+        if not isinstance(other, self.__class__):
+            other = self.frommembers(other)
+        return self & other == self
+
+    def issuperset(self, other) -> bool:
+        """Set containment."""
+        if not isinstance(other, self.__class__):
+            other = self.frommembers(other)
+        return self | other == self
+
+    def isdisjoint(self, other) -> bool:
+        """Set disjointness."""
+        if not isinstance(other, self.__class__):
+            other = self.frommembers(other)
+        return not self & other
+
+    def intersection(self, *others):
+        """Set intersection (of all others)."""
+        return reduce(operator.and_, map(self._coerce, others), self)
+
+    def union(self, *others):
+        """Set union (of all others)."""
+        return reduce(operator.or_, map(self._coerce, others), self)
+
+    def difference(self, *others):
+        """Set difference (from all others)."""
+        return reduce(operator.sub, map(self._coerce, others), self)
+
+    def symmetric_difference(self, other):
+        """Symmetric set difference."""
+        if not isinstance(other, self.__class__):
+            other = self.frommembers(other)
+        return self ^ other
+
+    def complement(self):
+        """Complement set."""
+        return self.supremum - self
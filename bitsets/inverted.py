@@ -0,0 +1,125 @@
+"""Inverted (member to rows bitmap) index for subset and superset queries."""
+
+from functools import reduce
+import operator
+
+from . import integers
+from . import transform
+
+__all__ = ['InvertedIndex']
+
+
+class InvertedIndex:
+    """Index of bitset rows by member for subset, superset, and overlap queries.
+
+    Args:
+        bitsets: Bitset sequence (or iterable of bitsets of class cls) to index.
+        cls: Bitset class of the rows (default: ``bitsets.BitSet``).
+
+    For each domain member, the index keeps an integer with bit j set if row
+    j contains the member. Queries combine these with a few bitwise operations
+    and return the ids (insertion positions) of the matching rows. Rows from
+    ``add()`` are merged into these integers in bulk by the next query.
+    """
+
+    def __init__(self, bitsets=(), cls=None) -> None:
+        if cls is None:
+            try:
+                cls = bitsets.BitSet
+            except AttributeError:
+                raise TypeError(f'cls required for bitsets without BitSet: {bitsets!r}') from None
+        self.BitSet = cls
+        self._rows: list = []  # None for removed rows
+        self._columns = [0] * cls._len
+        self._live = 0
+        self._merged = 0  # rows before are in _columns and _live
+        self.extend(bitsets)
+
+    def __len__(self) -> int:
+        """Return the number of (not removed) rows."""
+        self._merge()
+        return integers.bit_count(self._live)
+
+    def __getitem__(self, row: int):
+        """Return the bitset of row id."""
+        result = self._rows[row]
+        if result is None:
+            raise KeyError(f'removed row: {row!r}')
+        return result
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} of {len(self)} {self.BitSet.__name__}>'
+
+    def _merge(self) -> None:
+        start, stop = self._merged, len(self._rows)
+        if start == stop:
+            return
+        columns = transform.transpose(map(int, self._rows[start:]), self.BitSet._len)
+        self._columns = [c | n << start for c, n in zip(self._columns, columns)]
+        self._live |= integers.bit_mask(stop - start) << start
+        self._merged = stop
+
+    def extend(self, bitsets) -> range:
+        """Add bitsets as new rows, return their row ids."""
+        start = len(self._rows)
+        self._rows.extend(bitsets)
+        self._merge()
+        return range(start, len(self._rows))
+
+    def add(self, bitset) -> int:
+        """Add bitset as new row, return its row id (merged by the next query)."""
+        self._rows.append(bitset)
+        return len(self._rows) - 1
+
+    def remove(self, row: int) -> None:
+        """Remove the row with the given row id.
+
+        Raises:
+            KeyError: if the row id is negative, unknown, or already removed.
+        """
+        if row < 0:
+            raise KeyError(f'negative row: {row!r}')
+        if row >= len(self._rows):
+            raise KeyError(f'unknown row: {row!r}')
+        bitset = self[row]
+        self._merge()
+        mask = ~(1 << row)
+        for i in bitset.iter_set():
+            self._columns[i] &= mask
+        self._live &= mask
+        self._rows[row] = None
+
+    def _coerce(self, query):
+        self._merge()  # every query coerces first
+        if not isinstance(query, self.BitSet):
+            query = self.BitSet.frommembers(query)
+        return query
+
+    def _columns_of(self, indexes):
+        return map(self._columns.__getitem__, indexes)
+
+    def _supersets(self, query) -> int:
+        return reduce(operator.and_, self._columns_of(query.iter_set()), self._live)
+
+    def _subsets(self, query) -> int:
+        outside = self._columns_of(self.BitSet._indexes(query ^ self.BitSet.supremum))
+        return self._live & ~reduce(operator.or_, outside, 0)
+
+    def supersets(self, query) -> list[int]:
+        """Return the ids of rows that are supersets of query."""
+        return list(integers.indexes_auto(self._supersets(self._coerce(query))))
+
+    def subsets(self, query) -> list[int]:
+        """Return the ids of rows that are subsets of query."""
+        return list(integers.indexes_auto(self._subsets(self._coerce(query))))
+
+    def equal(self, query) -> list[int]:
+        """Return the ids of rows that are equal to query."""
+        query = self._coerce(query)
+        return list(integers.indexes_auto(self._supersets(query) & self._subsets(query)))
+
+    def intersecting(self, query) -> list[int]:
+        """Return the ids of rows that share at least one member with query."""
+        query = self._coerce(query)
+        return list(integers.indexes_auto(reduce(operator.or_,
+                                                 self._columns_of(query.iter_set()), 0)))
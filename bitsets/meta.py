@@ -1,9 +1,82 @@
 """Dynamic bitset class creation and retrieval/unpickling."""
 
+from collections.abc import Callable, Mapping, Sequence
 import copyreg
-from itertools import filterfalse
+from itertools import repeat
+import operator
+import threading
+from typing import Any
+import weakref
 
-__all__ = ['MemberBitsMeta', 'SeriesMeta']
+from . import integers
+
+__all__ = ['MemberBitsMeta', 'SeriesMeta',
+           'cached_classproperty', 'Atoms', 'AtomMap',
+           'member_index', 'RangeIndex',
+           'fingerprint', 'registered_classes']
+
+
+EAGER_ATOMS = 4_096  # larger domains compute singletons on demand
+
+
+def fingerprint(name: str, members, id: int) -> tuple:
+    """Return the registry key of the bitset class with name, members, and id.
+
+    Computed in constant time (without hashing members): classes with equal
+    fingerprint share a registry bucket and are told apart by their members.
+
+    >>> fingerprint('Nums', range(4), 1)
+    ('Nums', 1, 4)
+    """
+    return name, id, len(members)
+
+
+_registry: dict[tuple, list] = {}  # fingerprint -> weak references to classes
+
+_registry_stale: list[tuple] = []  # fingerprints of collected classes (to prune)
+
+_registry_lock = threading.RLock()
+
+
+def _register(cls) -> None:
+    """Add cls to the registry (call with _registry_lock held)."""
+    key = cls._fingerprint
+    ref = weakref.ref(cls, lambda _: _registry_stale.append(key))
+    _registry.setdefault(key, []).append(ref)
+
+
+def _lookup(name: str, members, id: int):
+    """Return the registered class with name, members, and id or None (call with lock held)."""
+    for ref in _registry.get(fingerprint(name, members, id), ()):
+        cls = ref()
+        if cls is not None and (cls._members is members or cls._members == members):
+            return cls
+    return None
+
+
+def _prune() -> None:
+    """Drop the weak references of collected classes (call with lock held)."""
+    while _registry_stale:
+        key = _registry_stale.pop()
+        bucket = [r for r in _registry.get(key, ()) if r() is not None]
+        if bucket:
+            _registry[key] = bucket
+        else:
+            _registry.pop(key, None)
+
+
+def registered_classes() -> list:
+    """Return the bitset classes currently registered for retrieval/unpickling.
+
+    >>> import bitsets
+    >>> Registered = bitsets.bitset('Registered', 'ab')
+    >>> Registered in registered_classes()
+    True
+    """
+    with _registry_lock:
+        _prune()
+        return [cls for bucket in _registry.values()
+                for cls in (r() for r in bucket) if cls is not None]
 
 
 def register_reduce(mcls):
@@ -12,13 +85,135 @@ def register_reduce(mcls):
     return mcls
 
 
+class cached_classproperty:  # noqa: N801
+    """Class attribute computed from the class on first access (then cached on it).
+
+    Accessed on a class without domain (``_members``), e.g. an abstract base
+    class inspected by ``help()``, the descriptor returns itself (uncached).
+    """
+
+    def __init__(self, func) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if not hasattr(owner, '_members'):
+            return self
+        value = self.func(owner)
+        setattr(owner, self.name, value)
+        return value
+
+
+class Atoms(Sequence):
+    """Singleton sets of a bitset class by domain index computed on demand."""
+
+    __slots__ = ('_cls',)
+
+    def __init__(self, cls) -> None:
+        self._cls = cls
+
+    def __len__(self) -> int:
+        return self._cls._len
+
+    def __getitem__(self, index):
+        indexes = range(self._cls._len)[index]
+        if isinstance(index, slice):
+            return tuple(map(self.__getitem__, indexes))
+        return self._cls.fromint(1 << indexes)
+
+
+class AtomMap(Mapping):
+    """Singleton sets of a bitset class by domain member computed on demand."""
+
+    __slots__ = ('_cls',)
+
+    def __init__(self, cls) -> None:
+        self._cls = cls
+
+    def __len__(self) -> int:
+        return self._cls._len
+
+    def __iter__(self):
+        return iter(self._cls._members)
+
+    def __getitem__(self, member):
+        return self._cls.fromint(1 << self._cls._index[member])
+
+
+def member_index(members) -> Mapping:
+    """Return mapping from members to domain index (arithmetic for integer ranges).
+
+    >>> member_index('abc')
+    {'a': 0, 'b': 1, 'c': 2}
+
+    >>> member_index((3, 4, 5))
+    RangeIndex(range(3, 6))
+    """
+    if (not isinstance(members, range) and len(members) and type(members[0]) is int
+            and all(map(operator.eq, members, range(members[0], members[0] + len(members))))):
+        members = range(members[0], members[0] + len(members))
+    if isinstance(members, range):
+        return RangeIndex(members)
+    return dict(zip(members, range(len(members))))
+
+
+class RangeIndex(Mapping):
+    """Domain index of integer members computed from a range (arithmetic lookup)."""
+
+    __slots__ = ('_range',)
+
+    def __init__(self, members: range) -> None:
+        self._range = members
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __iter__(self):
+        return iter(self._range)
+
+    def __contains__(self, member) -> bool:
+        return member in self._range
+
+    def __getitem__(self, member) -> int:
+        try:
+            return self._range.index(member)
+        except ValueError:
+            raise KeyError(member) from None
+
+    def indexes(self, members) -> list[int]:
+        """Return the domain indexes of members computed in bulk.
+
+        Raises:
+            KeyError: if a member is not in the domain.
+        """
+        members = list(members)
+        if self._range.step == 1:
+            try:
+                indexes = list(map(operator.sub, members, repeat(self._range.start)))
+            except TypeError:
+                pass
+            else:
+                if all(map(isinstance, indexes, repeat(int))) and (
+                        not indexes or 0 <= min(indexes) <= max(indexes) < len(self)):
+                    return indexes
+        return list(map(self.__getitem__, members))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._range!r})'
+
+
 @register_reduce
 class MemberBitsMeta(type):
 
-    __registry = {}
+    supremum: Any  # class attributes of the bases used by the stream reducers
+
+    frombitset: Callable
 
     def _make_subclass(self, name, members, id=None,  # noqa: N804
-                       listcls=None, tuplecls=None):
+                       listcls=None, tuplecls=None, arraycls=None):
         if hasattr(self, '_members'):
             raise RuntimeError(f'{self!r} attempt _make_subclass')
 
@@ -26,15 +221,19 @@ class MemberBitsMeta(type):
         if id:
             dct['_id'] = id
 
-        cls = type(name, (self,), dct)
+        with _registry_lock:
+            cls = type(name, (self,), dct)
 
-        self.__registry[(cls.__name__, cls._members, cls._id)] = cls
+            for scls, attr in [(listcls, 'List'), (tuplecls, 'Tuple'),
+                               (arraycls, 'Array')]:
+                if scls is not None:
+                    scls = scls._make_subclass(name, cls)
+                    assert scls._series == attr
+                    setattr(cls, scls._series, scls)
 
-        for scls, attr in [(listcls, 'List'), (tuplecls, 'Tuple')]:
-            if scls is not None:
-                scls = scls._make_subclass(name, cls)
-                assert scls._series == attr
-                setattr(cls, scls._series, scls)
+            cls._fingerprint = fingerprint(cls.__name__, cls._members, cls._id)
+            _prune()
+            _register(cls)
 
         return cls
 
@@ -47,12 +246,9 @@ class MemberBitsMeta(type):
             return
 
         self._len = len(self._members)
-
-        self._atoms = tuple(self.fromint(1 << i) for i in range(self._len))
-        self._map = dict(zip(self._members, self._atoms))
+        self._nbytes = (self._len + 7) // 8
 
         self.infimum = self.fromint(0)  # all zeros
-        self.supremum = self.fromint((1 << self._len) - 1)  # all ones
 
         if not hasattr(self, '_id'):
             self._id = id(self)
@@ -63,49 +259,110 @@ class MemberBitsMeta(type):
 
         list_base = self.List.__base__.__name__ if hasattr(self, 'List') else None
         tuple_base = self.Tuple.__base__.__name__ if hasattr(self, 'Tuple') else None
+        array_base = f', {self.Array.__base__.__name__}' if hasattr(self, 'Array') else ''
         return (f'<class {self.__module__}.bitset('
                 f'{self.__name__!r}, {self._members!r}, {self._id:#x},'
-                f' {self.__base__.__name__}, {list_base}, {tuple_base})>')
+                f' {self.__base__.__name__}, {list_base}, {tuple_base}{array_base})>')
 
     def __reduce__(self):  # noqa: N804
         if not hasattr(self, '_members'):
             return self.__name__
 
-        return bitset, (self.__name__, self._members, self._id, self.__base__,
-                        self.List.__base__ if hasattr(self, 'List') else None,
-                        self.Tuple.__base__ if hasattr(self, 'Tuple') else None)
+        return bitset, self._series_args()
+
+    def _series_args(self):  # noqa: N804
+        args = (self.__name__, self._members, self._id, self.__base__,
+                self.List.__base__ if hasattr(self, 'List') else None,
+                self.Tuple.__base__ if hasattr(self, 'Tuple') else None)
+        if hasattr(self, 'Array'):
+            args += (self.Array.__base__,)
+        return args
 
-    def _get_subclass(self, name, members, id, listcls, tuplecls):  # noqa: N804
+    def _get_subclass(self, name, members, id, listcls, tuplecls,  # noqa: N804
+                      arraycls=None):
         """Return or create class with name, members, and id (for unpickling)."""
         if not isinstance(id, int):
             raise RuntimeError(f'non-integer id: {id!r}')
 
-        if (name, members, id) in self.__registry:  # enable roundtrip reprs
-            return self.__registry[(name, members, id)]
+        with _registry_lock:  # enable roundtrip reprs
+            cls = _lookup(name, members, id)
+            if cls is not None:
+                return cls
 
-        return self._make_subclass(name, members, id, listcls, tuplecls)
+            return self._make_subclass(name, members, id, listcls, tuplecls, arraycls)
 
     def atomic(self, bitset):  # noqa: N804
         """Member singleton generator."""
-        return filter(bitset.__and__, self._atoms)
+        return map(self._atoms.__getitem__, self._indexes(bitset))
 
     def inatomic(self, bitset):  # noqa: N804
         """Complement singleton generator."""
-        return filterfalse(bitset.__and__, self._atoms)
+        return map(self._atoms.__getitem__, self._indexes(bitset ^ self.supremum))
 
     def reduce_and(self, bitsets):  # noqa: N804
-        """Generalized intersection."""
-        inters = self.supremum.copy()
-        for b in bitsets:
-            inters &= b
-        return self.frombitset(inters)
+        """Generalized intersection (stops consuming bitsets at ``infimum``)."""
+        return self.stream_and(bitsets)[0]
 
     def reduce_or(self, bitsets):  # noqa: N804
-        """Generalized union."""
-        union = self.infimum.copy()
-        for b in bitsets:
+        """Generalized union (stops consuming bitsets at ``supremum``)."""
+        return self.stream_or(bitsets)[0]
+
+    def stream_and(self, bitsets, buffers: bool = False):  # noqa: N804
+        """Return generalized intersection and the number of consumed bitsets.
+
+        Stops consuming bitsets as soon as the intersection is ``infimum``.
+        With buffers=True, reduce an iterable of buffers of packed rows
+        (e.g. from ``Series.tobytes()``) chunk-wise.
+        """
+        if buffers:
+            return self._stream_buffers(bitsets, operator.and_, self.supremum,
+                                        self.infimum)
+
+        inters, infimum = self.supremum.copy(), self.infimum
+        consumed = 0
+        for consumed, b in enumerate(bitsets, 1):
+            inters &= b
+            if inters == infimum:
+                break
+        return self.frombitset(inters), consumed
+
+    def stream_or(self, bitsets, buffers: bool = False):  # noqa: N804
+        """Return generalized union and the number of consumed bitsets.
+
+        Stops consuming bitsets as soon as the union is ``supremum``.
+        With buffers=True, reduce an iterable of buffers of packed rows
+        (e.g. from ``Series.tobytes()``) chunk-wise.
+        """
+        if buffers:
+            return self._stream_buffers(bitsets, operator.or_, self.infimum,
+                                        self.supremum)
+
+        union, supremum = self.infimum.copy(), self.supremum
+        consumed = 0
+        for consumed, b in enumerate(bitsets, 1):
             union |= b
-        return self.frombitset(union)
+            if union == supremum:
+                break
+        return self.frombitset(union), consumed
+
+    def _stream_buffers(self, buffers, op, start, stop):  # noqa: N804
+        result, consumed = start, 0
+        for data in buffers:
+            rows, n = self._fold_buffer(data, op, start)
+            result = op(result, n) & self.supremum
+            consumed += rows
+            if result == stop:
+                break
+        return self.frombitset(result), consumed
+
+    def _fold_buffer(self, data, op, identity):  # noqa: N804
+        """Return number of rows and their reduction in O(log(rows)) int ops."""
+        data = memoryview(data).cast('B')
+        rows, rest = divmod(len(data), self._nbytes)
+        if rest:
+            raise ValueError(f'buffer size {len(data)} no multiple of {self._nbytes}')
+        n = int.from_bytes(data, 'little')
+        return rows, integers.fold(n, rows, self._nbytes * 8, op, identity)
 
 
 @register_reduce
@@ -117,7 +374,7 @@ class SeriesMeta(type):
 
         dct = {'BitSet': cls}
         if '__slots__' in self.__dict__:
-            dct['__slots__'] = self.__slots__
+            dct['__slots__'] = ()
         return type(f'{name}{self.__name__}', (self,), dct)
 
     def __repr__(self) -> str:  # noqa: N804
@@ -127,28 +384,32 @@ class SeriesMeta(type):
         bs = self.BitSet
         list_base = bs.List.__base__.__name__ if hasattr(bs, 'List') else None
         tuple_base = bs.Tuple.__base__.__name__ if hasattr(bs, 'Tuple') else None
+        array_base = f', {bs.Array.__base__.__name__}' if hasattr(bs, 'Array') else ''
         return (f'<class {self.__module__}.bitset_{self._series.lower()}('
                 f'{bs.__name__!r}, {bs._members!r}, {bs._id:#x}, {bs.__base__.__name__},'
-                f' {list_base}, {tuple_base})>')
+                f' {list_base}, {tuple_base}{array_base})>')
 
     def __reduce__(self):  # noqa: N804
         if not hasattr(self, 'BitSet'):
             return self.__name__
 
-        bitset_series = {'List': bitset_list, 'Tuple': bitset_tuple}[self._series]
-        bs = self.BitSet
-        return bitset_series, (bs.__name__, bs._members, bs._id, bs.__base__,
-                               bs.List.__base__ if hasattr(bs, 'List') else None,
-                               bs.Tuple.__base__ if hasattr(bs, 'Tuple') else None)
+        bitset_series = {'List': bitset_list,
+                         'Tuple': bitset_tuple,
+                         'Array': bitset_array}[self._series]
+        return bitset_series, self.BitSet._series_args()
+
+
+def bitset(name, members, id, basecls, listcls, tuplecls, arraycls=None):
+    return basecls._get_subclass(name, members, id, listcls, tuplecls, arraycls)
 
 
-def bitset(name, members, id, basecls, listcls, tuplecls):
-    return basecls._get_subclass(name, members, id, listcls, tuplecls)
+def bitset_list(name, members, id, basecls, listcls, tuplecls, arraycls=None):
+    return bitset(name, members, id, basecls, listcls, tuplecls, arraycls).List
 
 
-def bitset_list(name, members, id, basecls, listcls, tuplecls):
-    return bitset(name, members, id, basecls, listcls, tuplecls).List
+def bitset_tuple(name, members, id, basecls, listcls, tuplecls, arraycls=None):
+    return bitset(name, members, id, basecls, listcls, tuplecls, arraycls).Tuple
 
 
-def bitset_tuple(name, members, id, basecls, listcls, tuplecls):
-    return bitset(name, members, id, basecls, listcls, tuplecls).Tuple
+def bitset_array(name, members, id, basecls, listcls, tuplecls, arraycls=None):
+    return bitset(name, members, id, basecls, listcls, tuplecls, arraycls).Array
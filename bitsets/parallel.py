@@ -0,0 +1,140 @@
+"""Chunked reduction and set algebra of bitset sequences over executors.
+
+Chunks are shipped to the workers as packed bytes (see ``Series.tobytes``)
+instead of pickled bitset instances.
+"""
+
+import concurrent.futures
+import contextlib
+import functools
+from itertools import compress, repeat
+import operator
+
+from . import integers
+from . import transform
+from .series import Series
+
+__all__ = ['reduce_and', 'reduce_or',
+           'intersection', 'union',
+           'subsets', 'supersets']
+
+CHUNKSIZE = 10_000
+
+OPERATORS = {'and': operator.and_, 'or': operator.or_}
+
+
+def _rows(data: bytes, size: int):
+    return map(int.from_bytes, [data[i:i + size] for i in range(0, len(data), size)],
+               repeat(transform.LITTLE))
+
+
+def _reduce_chunk(data: bytes, size: int, op: str, identity: int) -> int:
+    n = int.from_bytes(data, 'little')
+    return integers.fold(n, len(data) // size, size * 8, OPERATORS[op], identity)
+
+
+def _map_chunk(data: bytes, other: bytes | int, size: int, op: str) -> bytes:
+    others = repeat(other) if isinstance(other, int) else _rows(other, size)
+    return b''.join(map(int.to_bytes, map(OPERATORS[op], _rows(data, size), others),
+                        repeat(size), repeat(transform.LITTLE)))
+
+
+def _filter_chunk(data: bytes, other: int, size: int, op: str) -> bytes:
+    rows = list(_rows(data, size))
+    return bytes(map(operator.eq, map(OPERATORS[op], rows, repeat(other)), rows))
+
+
+@contextlib.contextmanager
+def _executor(executor, workers):
+    if executor is not None:
+        yield executor
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        yield executor
+
+
+def _chunks(series, chunksize: int):
+    data, size = series.tobytes(), series.BitSet._nbytes
+    step = chunksize * size
+    return [data[i:i + step] for i in range(0, len(data), step)]
+
+
+def _coerce(series, bitset):
+    if not isinstance(bitset, series.BitSet):
+        bitset = series.BitSet.frommembers(bitset)
+    return bitset.int
+
+
+def _reduce(series, op, identity, executor, workers, chunksize):
+    chunks = _chunks(series, chunksize)
+    size = series.BitSet._nbytes
+    with _executor(executor, workers) as executor:
+        results = executor.map(_reduce_chunk, chunks, repeat(size), repeat(op),
+                               repeat(identity))
+        result = functools.reduce(OPERATORS[op], results, identity)
+    return series.BitSet.frombitset(result & series.BitSet.supremum.int)
+
+
+def reduce_and(series, executor=None, *, workers=None, chunksize: int = CHUNKSIZE):
+    """Return the intersection of all series elements computed chunk-wise.
+
+    Args:
+        series: Bitset sequence (``List``, ``Tuple``, or ``Array``).
+        executor: :class:`concurrent.futures.Executor` to map the chunks with.
+        workers: Number of processes if no executor is given.
+        chunksize: Number of series elements per chunk.
+    """
+    return _reduce(series, 'and', series.BitSet.supremum.int,
+                   executor, workers, chunksize)
+
+
+def reduce_or(series, executor=None, *, workers=None, chunksize: int = CHUNKSIZE):
+    """Return the union of all series elements computed chunk-wise."""
+    return _reduce(series, 'or', 0, executor, workers, chunksize)
+
+
+def _map(series, other, op, executor, workers, chunksize):
+    chunks = _chunks(series, chunksize)
+    size = series.BitSet._nbytes
+    if isinstance(other, Series):
+        if len(other) != len(series):
+            raise ValueError(f'series length mismatch: {len(series)} != {len(other)}')
+        others = _chunks(other, chunksize)
+    else:
+        others = repeat(_coerce(series, other))
+    with _executor(executor, workers) as executor:
+        results = executor.map(_map_chunk, chunks, others, repeat(size), repeat(op))
+        return series.frombytes(b''.join(results))
+
+
+def intersection(series, other, executor=None, *, workers=None,
+                 chunksize: int = CHUNKSIZE):
+    """Return the element-wise intersections with a bitset or an equal-length series."""
+    return _map(series, other, 'and', executor, workers, chunksize)
+
+
+def union(series, other, executor=None, *, workers=None,
+          chunksize: int = CHUNKSIZE):
+    """Return the element-wise unions with a bitset or an equal-length series."""
+    return _map(series, other, 'or', executor, workers, chunksize)
+
+
+def _filter(series, bitset, op, executor, workers, chunksize):
+    chunks = _chunks(series, chunksize)
+    size, other = series.BitSet._nbytes, _coerce(series, bitset)
+    with _executor(executor, workers) as executor:
+        mask = b''.join(executor.map(_filter_chunk, chunks, repeat(other),
+                                     repeat(size), repeat(op)))
+    return series.frombitsets(list(compress(series, mask)))
+
+
+def subsets(series, bitset, executor=None, *, workers=None,
+            chunksize: int = CHUNKSIZE):
+    """Return the series elements that are subsets of bitset."""
+    return _filter(series, bitset, 'and', executor, workers, chunksize)
+
+
+def supersets(series, bitset, executor=None, *, workers=None,
+              chunksize: int = CHUNKSIZE):
+    """Return the series elements that are supersets of bitset."""
+    return _filter(series, bitset, 'or', executor, workers, chunksize)
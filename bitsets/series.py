@@ -1,8 +1,29 @@
 """Sequences (ordered collections) of bitset instances."""
 
+import array
+import base64
+import binascii
+from collections.abc import Callable, Iterator
+from functools import reduce
+from itertools import compress, islice, repeat
+import operator
+import pickle
+import sys
+from typing import SupportsIndex
+
+from . import bases
+from . import integers
 from . import meta
+from . import transform
 
-__all__ = ['List', 'Tuple']
+__all__ = ['List', 'Tuple', 'Array']
+
+CODECS = ('bits', 'hex', 'base64')
+
+
+def _frombytes(cls, data):
+    """Return a series of class cls from packed little-endian rows (unpickling)."""
+    return cls.frombytes(data)
 
 
 class Series(metaclass=meta.SeriesMeta):
@@ -10,6 +31,16 @@ class Series(metaclass=meta.SeriesMeta):
 
     __slots__ = ()
 
+    BitSet: type[bases.MemberBits]
+
+    __iter__: Callable[..., Iterator]  # from the sequence base (list, tuple, or Array)
+
+    __len__: Callable[..., int]
+
+    __getitem__: Callable
+
+    frombitsets: Callable  # classmethod of the sequence classes
+
     @classmethod
     def frommembers(cls, members):
         """Series from iterable of member iterables."""
@@ -17,8 +48,63 @@ class Series(metaclass=meta.SeriesMeta):
 
     @classmethod
     def frombools(cls, bools):
-        """Series from iterable of boolean evaluable iterables."""
-        return cls.frombitsets(map(cls.BitSet.frombools, bools))
+        """Series from iterable of boolean evaluable iterables (e.g. 2-D array)."""
+        length, width = cls.BitSet._len, cls.BitSet._nbytes * 8
+        rows = (b if hasattr(b, '__len__') else islice(b, length) for b in bools)
+        data = b''.join(transform.boolbytes(b)[:length].ljust(width, b'\0')
+                        for b in rows)
+        return cls.frombytes(transform.packbytes(data))
+
+    @classmethod
+    def frombytes(cls, data):
+        """Series from buffer of packed little-endian ``BitSet._nbytes`` rows."""
+        data = bytes(data)
+        size, length = cls.BitSet._nbytes, cls.BitSet._len
+        if len(data) % size:
+            raise ValueError(f'buffer size {len(data)} no multiple of {size}')
+        if length % 8 and max(data[size - 1::size], default=0) >> length % 8:
+            raise ValueError('too many bits in buffer')
+        if size * 8 in transform.TYPECODES and sys.byteorder == 'little':
+            ints = array.array(transform.TYPECODES[size * 8], data)  # no row slicing
+        else:
+            rows = [data[i:i + size] for i in range(0, len(data), size)]
+            ints = map(int.from_bytes, rows, repeat('little'))
+        return cls.frombitsets(map(cls.BitSet.fromint, ints))
+
+    @classmethod
+    def fromindexes(cls, indexes):
+        """Series from iterable of domain index sequences (e.g. index arrays)."""
+        length, width = cls.BitSet._len, cls.BitSet._nbytes * 8
+        data = bytearray()
+        for row in indexes:
+            row = tuple(row)
+            if min(row, default=0) < 0 or max(row, default=0) >= length:
+                raise IndexError(f'domain index out of range: {row!r}')
+            bools = bytearray(width)
+            for i in row:
+                bools[i] = 1
+            data += bools
+        return cls.frombytes(transform.packbytes(data))
+
+    @classmethod
+    def fromcolumns(cls, columns, length: int | None = None):
+        """Series from member-major row bitmaps (see ``columns()``).
+
+        Args:
+            columns: Mapping from members to integers with bit j set if row j
+                contains the member, or sequence of such integers in domain order.
+            length: Number of rows (default: highest set row bit plus one).
+        """
+        if hasattr(columns, 'keys'):
+            columns = list(map(columns.get, cls.BitSet._members, repeat(0)))
+        elif len(columns) != cls.BitSet._len:
+            raise ValueError(f'{len(columns)} columns for domain of {cls.BitSet._len}')
+        if length is None:
+            length = max(map(int.bit_length, columns), default=0)
+        elif any(c >> length for c in columns):
+            raise ValueError(f'row bits beyond length {length}')
+        return cls.frombitsets(map(cls.BitSet.fromint,
+                                   transform.transpose(columns, length)))
 
     @classmethod
     def frombits(cls, bits):
@@ -30,6 +116,59 @@ class Series(metaclass=meta.SeriesMeta):
         """Series from integer rank arguments."""
         return cls.frombitsets(map(cls.BitSet.fromint, ints))
 
+    @classmethod
+    def decode(cls, text: str, codec: str = 'bits', sep: str = '\n'):
+        """Series from sep-separated rows encoded with codec (see ``encode()``)."""
+        if codec not in CODECS:
+            raise ValueError(f'unknown codec: {codec!r}')
+        if not text:
+            return cls.frombitsets([])
+        if codec == 'bits':  # reverse once instead of every row
+            rows = text[::-1].split(sep[::-1])
+            if max(map(len, rows)) > cls.BitSet._len:
+                raise ValueError(f'too many bits in row for {cls.BitSet._len}')
+            ints = list(map(int, rows, repeat(2)))
+            ints.reverse()
+            return cls.fromints(ints)
+
+        size = cls.BitSet._nbytes
+        width = size * 2 if codec == 'hex' else (size + 2) // 3 * 4
+        rows = text.split(sep)
+        if any(len(r) != width for r in rows):
+            raise ValueError(f'{codec} rows of length {width} expected')
+        if codec == 'hex':
+            data = bytes.fromhex(''.join(rows))
+        else:
+            data = b''.join(map(binascii.a2b_base64, rows))
+        return cls.frombytes(data)
+
+    def encode(self, codec: str = 'bits', sep: str = '\n') -> str:
+        """Return the series as string of sep-separated rows in one pass.
+
+        Args:
+            codec: ``'bits'`` (binary membership strings as ``bits()``),
+                ``'hex'``, or ``'base64'`` (little-endian bytes as ``tobytes()``).
+            sep: Row separator (not occurring in the encoded rows).
+        """
+        if codec not in CODECS:
+            raise ValueError(f'unknown codec: {codec!r}')
+        if codec == 'bits':  # rows in reverse order, reversing the result reverses each row
+            fmt = f'0{self.BitSet._len}b'
+            rows = self._ranks(reversed(self))
+            return sep[::-1].join(map(format, rows, repeat(fmt)))[::-1]
+
+        size, data = self.BitSet._nbytes, self.tobytes()
+        rows = [data[i:i + size] for i in range(0, len(data), size)]
+        if codec == 'hex':
+            return sep.join(map(bytes.hex, rows))
+        return sep.join(map(bytes.decode, map(base64.b64encode, rows)))
+
+    def _ranks(self, bitsets):
+        """Return bitsets as integers (rank conversion for non-int e.g. compressed bitsets)."""
+        if issubclass(self.BitSet, int):
+            return bitsets
+        return map(int, bitsets)
+
     def members(self, as_set=False):
         """Return the series as list of set member tuples/frozensets."""
         return [b.members(as_set) for b in self]
@@ -46,6 +185,82 @@ class Series(metaclass=meta.SeriesMeta):
         """Return the series as list of integers ranks."""
         return [b.int for b in self]
 
+    def tobytes(self) -> bytes:
+        """Return the series as packed little-endian ``BitSet._nbytes`` rows."""
+        return b''.join(map(int.to_bytes, self._ranks(self), repeat(self.BitSet._nbytes),
+                            repeat(transform.LITTLE)))
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self.tobytes())
+
+    def __reduce_ex__(self, protocol: SupportsIndex):
+        """Pickle word-sized rows as one packed payload (out-of-band under protocol 5)."""
+        packable = (issubclass(self.BitSet, int)
+                    # wider rows unpickle faster per element (no slicing)
+                    and self.BitSet._nbytes * 8 in transform.TYPECODES
+                    # other items e.g. from list.append()
+                    and all(map(isinstance, self, repeat(self.BitSet))))
+        if not packable:
+            return super().__reduce_ex__(protocol)
+        data = self.tobytes()
+        if operator.index(protocol) >= 5:
+            return _frombytes, (self.__class__, pickle.PickleBuffer(data))
+        return _frombytes, (self.__class__, data)
+
+    def columns(self) -> dict:
+        """Return member-major (bit-sliced) form: member to bitmap of containing rows.
+
+        Bit j of the value for a member is set if the j-th element contains it.
+        """
+        return dict(zip(self.BitSet._members,
+                        transform.transpose(map(int, self), self.BitSet._len)))
+
+    def where(self, include=(), exclude=(), columns=None) -> list[int]:
+        """Return indexes of the elements containing all include and no exclude members.
+
+        Pass the ``columns()`` of the series to evaluate repeated queries with
+        one AND/OR per member.
+        """
+        if columns is None:
+            include = self.BitSet.frommembers(include)
+            exclude = self.BitSet.frommembers(exclude)
+            matches = map(operator.eq, map(operator.and_, self, repeat(include | exclude)),
+                          repeat(include))
+            return list(compress(range(len(self)), matches))
+
+        rows = reduce(operator.and_, map(columns.__getitem__, include),
+                      integers.bit_mask(len(self)))
+        rows &= ~reduce(operator.or_, map(columns.__getitem__, exclude), 0)
+        return list(integers.indexes_auto(rows))
+
+    def _sortkeys(self, order: str) -> list[int]:
+        """Return integer sort keys for all elements computed in one pass."""
+        if order not in ('shortlex', 'longlex', 'shortcolex', 'longcolex'):
+            raise ValueError(f'unknown order: {order!r}')
+
+        length, size = self.BitSet._len, self.BitSet._nbytes
+        if order.endswith('colex'):
+            values = map(int, self)
+        else:  # reinverted (see integers.reinverted_optimized)
+            data = self.tobytes().translate(transform.RBYTESTABLE)
+            rows = [data[i:i + size] for i in range(0, len(data), size)]
+            values = map(operator.xor,
+                         map(operator.rshift, map(int.from_bytes, rows, repeat(transform.BIG)),
+                             repeat(size * 8 - length)),
+                         repeat(self.BitSet.supremum.int))
+
+        counts = map(integers.bit_count, self._ranks(self))
+        if order.startswith('long'):
+            counts = map(operator.sub, repeat(length), counts)
+        return list(map(operator.or_, map(operator.lshift, counts, repeat(length)),
+                        values))
+
+    def sorted(self, order: str = 'shortlex', reverse: bool = False):
+        """Return the series sorted by 'shortlex', 'longlex', 'shortcolex', or 'longcolex'."""
+        keys = self._sortkeys(order)
+        indexes = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        return self.frombitsets(list(map(self.__getitem__, indexes)))
+
     def __repr__(self) -> str:
         items = ', '.join(f'{b.bits()!r}' for b in self)
         return f'{self.__class__.__name__}({items})'
@@ -86,6 +301,15 @@ class List(Series, list):
     def __init__(self, *bits) -> None:
         list.__init__(self, map(self.BitSet.frombits, bits))
 
+    def sort(self, *, key=None, reverse: bool = False, order: str | None = None) -> None:
+        """Sort the list in place (by key function or by order, see ``sorted()``)."""
+        if order is not None:
+            if key is not None:
+                raise ValueError('cannot sort by both key and order')
+            self[:] = self.sorted(order, reverse=reverse)
+        else:
+            list.sort(self, key=key, reverse=reverse)
+
 
 class Tuple(Series, tuple):
     """Immutable bitset sequence.
@@ -102,3 +326,145 @@ class Tuple(Series, tuple):
 
     def __new__(cls, *bits):
         return tuple.__new__(cls, map(cls.BitSet.frombits, bits))
+
+
+class Array(Series):
+    """Compact immutable bitset sequence stored as a matrix of 64-bit words.
+
+    Args:
+        *bits(str): Strings with the binary membership representation.
+
+    Each row occupies ``_nwords`` 64-bit words of ``words`` holding the bytes of
+    the row in little-endian order (on every platform, so the ``array.array``
+    items are byte-swapped on big-endian ones). The buffer (``memoryview(a)``)
+    exports this word layout, read it back with ``fromwords()`` (use
+    ``numpy.frombuffer(a.words, '<u8').reshape(-1, a._nwords)`` for NumPy).
+    Unlike ``tobytes()``, rows are padded to whole words.
+    """
+
+    __slots__ = ('words',)
+
+    words: array.array
+
+    _nwords: int
+
+    _series = 'Array'
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, 'BitSet'):
+            cls._nwords = max(1, (cls.BitSet._len + 63) // 64)
+
+    @classmethod
+    def frombitsets(cls, bitsets):
+        width = cls._nwords * 8
+        data = b''.join(int.to_bytes(b, width, 'little') for b in bitsets)
+        return cls._fromwords(array.array('Q', data))
+
+    @classmethod
+    def fromwords(cls, data):
+        """Array from buffer of rows of ``_nwords`` little-endian 64-bit words."""
+        data = bytes(data)
+        width = cls._nwords * 8
+        if len(data) % width:
+            raise ValueError(f'buffer size {len(data)} no multiple of {width}')
+        mask = integers.bit_mask(width * 8) ^ integers.bit_mask(cls.BitSet._len)  # row padding
+        padding = mask.to_bytes(width, 'little') * (len(data) // width)
+        if int.from_bytes(data, 'little') & int.from_bytes(padding, 'little'):
+            raise ValueError('too many bits in buffer')
+        return cls._fromwords(array.array('Q', data))
+
+    @classmethod
+    def _fromwords(cls, words):
+        self = object.__new__(cls)
+        self.words = words
+        return self
+
+    def __new__(cls, *bits):
+        return cls.frombitsets(map(cls.BitSet.frombits, bits))
+
+    def __reduce_ex__(self, protocol: SupportsIndex):
+        return self.__class__._fromwords, (self.words,)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self.words)  # zero-copy (rows of _nwords * 8 bytes, see fromwords())
+
+    def __len__(self) -> int:
+        return len(self.words) // self._nwords
+
+    def _row(self, index: int):
+        n = self._nwords
+        return self.BitSet.fromint(int.from_bytes(self.words[index * n:index * n + n],
+                                                  'little'))
+
+    def __getitem__(self, index):
+        indexes = range(len(self))[index]
+        if isinstance(index, slice):
+            return self.frombitsets(map(self._row, indexes))
+        return self._row(indexes)
+
+    def __iter__(self):
+        return map(self._row, range(len(self)))
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.words == other.words
+
+    def __hash__(self) -> int:
+        return hash(self.words.tobytes())
+
+    def _word_columns(self):
+        n = self._nwords
+        return [self.words[i::n] for i in range(n)]
+
+    def _fromcolumn_words(self, words):
+        return self.BitSet.fromint(int.from_bytes(array.array('Q', words), 'little'))
+
+    def _broadcast(self, bitset):
+        if not isinstance(bitset, self.BitSet):
+            bitset = self.BitSet.frommembers(bitset)
+        return array.array('Q', bitset.to_bytes(self._nwords * 8, 'little')) * len(self)
+
+    def reduce_and(self):
+        """Return the intersection of all array rows."""
+        inters = self._fromcolumn_words(reduce(operator.and_, c, (1 << 64) - 1)
+                                        for c in self._word_columns())
+        return self.BitSet.frombitset(inters & self.BitSet.supremum)
+
+    def reduce_or(self):
+        """Return the union of all array rows."""
+        return self._fromcolumn_words(reduce(operator.or_, c, 0)
+                                      for c in self._word_columns())
+
+    def intersection(self, bitset):
+        """Return the array of row-wise intersections with bitset."""
+        return self._fromwords(array.array('Q', map(operator.and_, self.words,
+                                                    self._broadcast(bitset))))
+
+    def union(self, bitset):
+        """Return the array of row-wise unions with bitset."""
+        return self._fromwords(array.array('Q', map(operator.or_, self.words,
+                                                    self._broadcast(bitset))))
+
+    def counts(self) -> list[int]:
+        """Return the list of row cardinalities."""
+        counts = map(integers.bit_count, self.words)
+        if self._nwords > 1:
+            counts = map(sum, zip(*[counts] * self._nwords))
+        return list(counts)
+
+    def _rowwise(self, words):
+        if self._nwords > 1:
+            words = map(all, zip(*[iter(words)] * self._nwords))
+        return list(words)
+
+    def issubset(self, bitset) -> list[bool]:
+        """Return the list of row-wise subset tests against bitset."""
+        return self._rowwise(map(operator.eq, self.intersection(bitset).words,
+                                 self.words))
+
+    def issuperset(self, bitset) -> list[bool]:
+        """Return the list of row-wise superset tests against bitset."""
+        return self._rowwise(map(operator.eq, self.union(bitset).words,
+                                 self.words))
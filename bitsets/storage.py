@@ -0,0 +1,129 @@
+"""Binary file format for bitset sequences with memory-mapped reading.
+
+File layout (little-endian): ``MAGIC``, header size, row width in bytes,
+number of rows (``HEADER``), the pickled bitset class (header), zero padding
+to a multiple of 8 bytes, and the fixed-width rows (see ``MemberBits.tobytes``).
+
+Note: the header is unpickled on reading, only open files from trusted sources.
+"""
+
+from itertools import islice
+import mmap
+import os
+import pickle
+import struct
+
+__all__ = ['dump', 'load', 'MappedSeries']
+
+MAGIC = b'BITSETS\x01'
+
+HEADER = struct.Struct('<8sQQQ')
+
+CHUNKSIZE = 4_096
+
+
+def _payload_offset(header_size: int) -> int:
+    return (HEADER.size + header_size + 7) // 8 * 8
+
+
+def dump(bitsets, filename: os.PathLike | str, cls=None) -> int:
+    """Write bitsets (of class cls, default: ``bitsets.BitSet``) into filename.
+
+    Returns:
+        The number of rows written.
+    """
+    if cls is None:
+        cls = bitsets.BitSet
+
+    header = pickle.dumps(cls, protocol=pickle.HIGHEST_PROTOCOL)
+    offset = _payload_offset(len(header))
+    width = cls._nbytes
+    count = 0
+
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(header), width, 0))
+        f.write(header.ljust(offset - HEADER.size, b'\0'))
+
+        bitsets = iter(bitsets)
+        while chunk := list(islice(bitsets, CHUNKSIZE)):
+            f.write(b''.join(map(cls.tobytes, chunk)))
+            count += len(chunk)
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, len(header), width, count))
+
+    return count
+
+
+def load(filename: os.PathLike | str) -> 'MappedSeries':
+    """Return a lazy random-access sequence of the bitsets in filename."""
+    return MappedSeries(filename)
+
+
+class MappedSeries:
+    """Read-only bitset sequence backed by a memory-mapped file.
+
+    Args:
+        filename: Path of a file written by ``dump()``.
+    Raises:
+        ValueError: if the file is not in the expected format.
+    """
+
+    def __init__(self, filename: os.PathLike | str) -> None:
+        with open(filename, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f'not a bitsets file: {filename!r}')
+
+        magic, size, width, count = HEADER.unpack_from(self._mmap)
+        offset = _payload_offset(size)
+        if magic != MAGIC or len(self._mmap) < offset + width * count:
+            self._mmap.close()
+            raise ValueError(f'not a bitsets file: {filename!r}')
+
+        self.BitSet = pickle.loads(self._mmap[HEADER.size:HEADER.size + size])
+        if width != self.BitSet._nbytes:
+            self._mmap.close()
+            raise ValueError(f'row width {width} mismatch for {self.BitSet!r}')
+
+        self._width = width
+        self._len = count
+        self._view = memoryview(self._mmap)[offset:offset + width * count]
+
+    def __enter__(self) -> 'MappedSeries':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory-mapping of the file."""
+        self._view.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _row(self, index: int):
+        start = index * self._width
+        n = int.from_bytes(self._view[start:start + self._width], 'little')
+        return self.BitSet.fromint(n)
+
+    def __getitem__(self, index):
+        indexes = range(self._len)[index]
+        if isinstance(index, slice):
+            return list(map(self._row, indexes))
+        return self._row(indexes)
+
+    def __iter__(self):
+        return map(self._row, range(self._len))
+
+    def iterchunks(self, rows: int = CHUNKSIZE):
+        """Yield buffers of packed rows (e.g. for ``stream_or(..., buffers=True)``)."""
+        size = rows * self._width
+        return (self._view[i:i + size] for i in range(0, len(self._view), size))
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} of {self._len} {self.BitSet.__name__}>'
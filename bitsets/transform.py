@@ -4,10 +4,16 @@ Note: chunks have little-endian bit-order
       like gmpy2.(un)pack, but reverse of numpy.(un)packbits
 """
 
+import array
 from collections.abc import Iterator, Mapping, Sequence
-from itertools import compress, zip_longest
+from itertools import compress, islice, repeat, zip_longest
+import sys
+from typing import Literal
 
-__all__ = ['chunkreverse', 'pack', 'unpack', 'packbools', 'unpackbools']
+__all__ = ['chunkreverse', 'pack', 'unpack', 'packbools', 'unpackbools',
+           'boolbytes', 'packbytes', 'unpackbytes',
+           'packarray', 'unpackarray', 'reversearray',
+           'transpose']
 
 NBITS: Mapping[int | str, int]
 NBITS = {'B': 8, 'H': 16, 'L': 32, 'Q': 64}
@@ -19,8 +25,23 @@ ATOMS.update((t, ATOMS[r]) for t, r in NBITS.items())
 
 NBITS.update({r: r for r in NBITS.values()})
 
+LITTLE: Literal['little'] = 'little'  # byteorder for map(int.from_bytes, ..., repeat(LITTLE))
+
+BIG: Literal['big'] = 'big'
+
 RBYTES = [int('{0:08b}'.format(i)[::-1], 2) for i in range(256)]
 
+BOOLCHARS = bytes.maketrans(b'\x00\x01', b'01')
+
+CHARBOOLS = bytes.maketrans(b'01', b'\x00\x01')
+
+RBYTESTABLE = bytes(RBYTES)
+
+TRANSPOSE_BITS = 1 << 23  # bound of the rows times r bit string per block
+
+TYPECODES: Mapping[int, str]
+TYPECODES = {array.array(t).itemsize * 8: t for t in 'QLIHB'}
+
 
 def chunkreverse(integers, dtype='L') -> Iterator[int]:
     """Yield integers of dtype bit-length reverting their bit-order.
@@ -113,3 +134,161 @@ def unpackbools(integers, dtype='L') -> Iterator[bool]:
     for chunk in integers:
         for a in atoms:
             yield not not chunk & a
+
+
+def boolbytes(bools) -> bytes:
+    """Return bytes with zero/one values from boolean evaluable items.
+
+    >>> boolbytes([True, False, 0, 1])
+    b'\\x01\\x00\\x00\\x01'
+
+    >>> boolbytes(['spam', '', None, 42])
+    b'\\x01\\x00\\x00\\x01'
+    """
+    if hasattr(bools, '__len__'):  # fast path for bool/int lists and buffers
+        try:
+            result = bytes(bools)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if len(result) == len(bools) and not result.translate(None, b'\x00\x01'):
+                return result
+    return bytes(map(bool, bools))
+
+
+def packbytes(bools) -> bytes:
+    """Return bytes concatenating a buffer of zero/one bytes in chunks of 8.
+
+    >>> packbytes(bytes([0, 1, 0, 1, 0, 1]))
+    b'*'
+
+    >>> packbytes(bytes([1, 0, 0, 0, 0, 0, 0, 0, 1]))
+    b'\\x01\\x01'
+    """
+    bools = bytes(bools)
+    if not bools:
+        return b''
+    n = int(bools.translate(BOOLCHARS)[::-1], 2)
+    return n.to_bytes((len(bools) + 7) // 8, 'little')
+
+
+def unpackbytes(data) -> bytes:
+    """Return bytes with zero/one values unpacking a buffer of bytes (packbytes inverse).
+
+    >>> unpackbytes(b'*')
+    b'\\x00\\x01\\x00\\x01\\x00\\x01\\x00\\x00'
+
+    >>> unpackbytes(b'')
+    b''
+    """
+    data = bytes(data)
+    if not data:
+        return b''
+    n = int.from_bytes(data, 'little')
+    return format(n, f'0{len(data) * 8}b')[::-1].encode('ascii').translate(CHARBOOLS)
+
+
+def _asarray(integers, dtype) -> array.array:
+    typecode = TYPECODES[NBITS[dtype]]
+    if isinstance(integers, array.array) and integers.typecode == typecode:
+        return integers
+    try:
+        view = memoryview(integers)
+    except TypeError:
+        return array.array(typecode, integers)
+    with view:  # native unsigned buffers of the same width (e.g. numpy.uint32)
+        result = array.array(typecode)
+        if view.format in TYPECODES.values() and view.itemsize == result.itemsize:
+            result.frombytes(view)
+            return result
+        return array.array(typecode, view.tolist())
+
+
+def packarray(bools, dtype='L') -> array.array:
+    """Return array of integers concatenating bools in chunks of dtype bit-length.
+
+    Bulk version of ``packbools()`` returning a buffer.
+
+    >>> packarray([False, True, False, True, False, True], 'B')
+    array('B', [42])
+
+    >>> packarray([True] * 9 + [False] * 6 + [True], 'H').tolist()
+    [33279]
+    """
+    result = array.array(TYPECODES[NBITS[dtype]])
+    data = packbytes(boolbytes(bools))
+    result.frombytes(data + bytes(-len(data) % result.itemsize))
+    if sys.byteorder != 'little':
+        result.byteswap()
+    return result
+
+
+def unpackarray(integers, dtype='L') -> bytes:
+    """Return bytes with zero/one values unpacking integers of dtype bit-length.
+
+    Bulk version of ``unpackbools()`` accepting buffers (``array.array``,
+    ``bytes``, numpy arrays) and returning a buffer.
+
+    >>> unpackarray([42], 'B')
+    b'\\x00\\x01\\x00\\x01\\x00\\x01\\x00\\x00'
+
+    >>> list(map(bool, unpackarray(array.array('H', [1]), 'H'))) == [True] + [False] * 15
+    True
+    """
+    integers = _asarray(integers, dtype)
+    if sys.byteorder != 'little':
+        integers = array.array(integers.typecode, integers)
+        integers.byteswap()
+    return unpackbytes(integers.tobytes())
+
+
+def reversearray(integers, dtype='L') -> array.array:
+    """Return array of integers of dtype bit-length reverting their bit-order.
+
+    Bulk version of ``chunkreverse()`` returning a buffer.
+
+    >>> reversearray([0b10000000, 0b11000000, 0b00000001], 'B')
+    array('B', [1, 3, 128])
+
+    >>> reversearray([0x8000, 0xC000, 0x0001], 'H').tolist()
+    [1, 3, 32768]
+    """
+    integers = _asarray(integers, dtype)
+    # reverse the bits of each byte, then the bytes of each item (any byteorder)
+    result = array.array(integers.typecode)
+    result.frombytes(integers.tobytes().translate(RBYTESTABLE))
+    if result.itemsize > 1:
+        result.byteswap()
+    return result
+
+
+def transpose(integers, r: int) -> list[int]:
+    """Return r integers transposing the bit matrix of r bit-length integers.
+
+    Bit j of the i-th result is bit i of integers[j].
+
+    >>> transpose([0b011, 0b110], 3)
+    [1, 3, 2]
+
+    >>> transpose([1, 3, 2], 2)
+    [3, 6]
+
+    >>> transpose([], 2)
+    [0, 0]
+
+    >>> transpose(iter([1] * 20), 1) == [(1 << 20) - 1]
+    True
+    """
+    # blocks of whole bytes of rows bound the temporary strings to TRANSPOSE_BITS
+    nrows = max(8, TRANSPOSE_BITS // max(r, 1) // 8 * 8)
+    fmt = f'0{r}b'
+    integers = iter(integers)
+    parts: list[list[bytes]] = [[] for _ in range(r)]
+    while block := list(islice(integers, nrows)):
+        # concatenate rows most significant bit first, reversing puts bit i of
+        # row j at position (len(block) - 1 - j) * r + i (so column i is [i::r])
+        bits = ''.join(map(format, block, repeat(fmt)))[::-1]
+        size = (len(block) + 7) // 8  # only the last block is shorter than nrows
+        for i, p in enumerate(parts):
+            p.append(int(bits[i::r] or '0', 2).to_bytes(size, 'little'))
+    return [int.from_bytes(b''.join(p), 'little') for p in parts]
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# flake8: noqa
+
+"""Run the microbenchmarks from benchmarks/ with timeit.
+
+Benchmarks are functions named ``bench_*`` in ``benchmarks/bench_*.py`` that
+return the callable to time for a given domain size (and density if they
+accept a ``density`` argument), over the module ``SIZES`` and ``DENSITIES``.
+
+Usage: run-benchmarks.py [PATTERN] [--save FILE] [--compare FILE] [--threshold RATIO]
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import pathlib
+import platform
+import sys
+import timeit
+
+SELF = pathlib.Path(__file__)
+
+DIRECTORY = SELF.parent / 'benchmarks'
+
+BASELINE = DIRECTORY / 'baseline.json'
+
+SIZES = [64, 2_000, 10_000]
+
+DENSITIES = [0.01, 0.5]
+
+REPEAT = 5
+
+THRESHOLD = 1.25
+
+
+def iterbenchmarks(pattern=None):
+    sys.path.insert(0, str(DIRECTORY))
+    for path in sorted(DIRECTORY.glob('bench_*.py')):
+        module = importlib.import_module(path.stem)
+        prefix = path.stem.removeprefix('bench_')
+        for name, func in vars(module).items():
+            if not name.startswith('bench_') or not callable(func):
+                continue
+            if 'density' in inspect.signature(func).parameters:
+                densities = getattr(module, 'DENSITIES', DENSITIES)
+            else:
+                densities = [None]
+            for size in getattr(module, 'SIZES', SIZES):
+                for density in densities:
+                    params = f'{size}' if density is None else f'{size},{density}'
+                    key = f'{prefix}.{name.removeprefix("bench_")}[{params}]'
+                    if pattern is None or pattern in key:
+                        yield key, func, size, density
+
+
+def measure(func, size, density=None, *, repeat=REPEAT) -> float:
+    kwargs = {} if density is None else {'density': density}
+    timer = timeit.Timer(func(size, **kwargs))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+parser = argparse.ArgumentParser(description=__doc__.partition('\n')[0])
+parser.add_argument('pattern', nargs='?', help='only run benchmarks with keys containing pattern')
+parser.add_argument('--save', metavar='FILE', nargs='?', const=BASELINE, type=pathlib.Path,
+                    help=f'write the results as JSON (default: {BASELINE.relative_to(SELF.parent)})')
+parser.add_argument('--compare', metavar='FILE', nargs='?', const=BASELINE, type=pathlib.Path,
+                    help='compare with results from --save, fail on slowdowns, list missing keys')
+parser.add_argument('--threshold', metavar='RATIO', type=float, default=THRESHOLD,
+                    help=f'time ratio flagged as slowdown (default: {THRESHOLD})')
+parser.add_argument('--repeat', type=int, default=REPEAT, help=f'timeit repeats (default: {REPEAT})')
+
+print('run', [SELF.name] + sys.argv[1:])
+args = parser.parse_args()
+
+baseline = json.loads(args.compare.read_text())['results'] if args.compare else {}
+results, slower, missing = {}, [], []
+
+for key, func, size, density in iterbenchmarks(args.pattern):
+    seconds = results[key] = measure(func, size, density, repeat=args.repeat)
+    line = f'{key:<56} {seconds * 1e6:12.3f} us'
+    if key in baseline:
+        ratio = seconds / baseline[key]
+        line += f' {ratio:8.2f}x'
+        if ratio > args.threshold:
+            line += '  SLOWER'
+            slower.append(key)
+    elif args.compare:
+        line += '  MISSING'
+        missing.append(key)
+    print(line)
+
+if missing:
+    print(f'{len(missing)} not in {args.compare} (re-record with --save):', *missing)
+
+if args.compare and args.pattern is None:
+    stale = [key for key in baseline if key not in results]
+    if stale:
+        print(f'{len(stale)} in {args.compare} but not run:', *stale)
+
+if args.save:
+    info = {'python': platform.python_version(), 'machine': platform.machine(),
+            'system': platform.system()}
+    args.save.write_text(json.dumps({'info': info, 'results': results}, indent=4) + '\n')
+    print('saved', args.save)
+
+if slower:
+    print(f'FAILED: {len(slower)} slower than {args.threshold}x baseline:', *slower)
+    sys.exit(1)
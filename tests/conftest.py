@@ -18,3 +18,16 @@ def Nums():  # noqa: N802
 @pytest.fixture(scope='session')
 def Four():  # noqa: N802
     return bitsets.bitset('Four', (1, 2, 3, 4))
+
+
+@pytest.fixture(scope='session')
+def Large():  # noqa: N802
+    return bitsets.bitset('Large', range(100), list=True, array=True)
+
+
+@pytest.fixture(scope='session')
+def Huge():  # noqa: N802
+    import bitsets.compressed
+
+    return bitsets.bitset('Huge', range(140_000), list=True,
+                          base=bitsets.compressed.CompressedBitSet)
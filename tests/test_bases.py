@@ -1,8 +1,11 @@
+import itertools
 import pickle
 import re
 
 import pytest
 
+import bitsets
+
 
 def test_reconstruct(Ints):  # noqa: N803
     assert pickle.loads(pickle.dumps(Ints('110011'))) == Ints('110011')
@@ -23,10 +26,30 @@ def test_frommembers(Ints):  # noqa: N803
     assert Ints.frommembers([1, 5, 6]) == Ints('100011')
 
 
+def test_frommembers_duplicates(Ints):  # noqa: N803
+    assert Ints.frommembers(iter([6, 1, 5, 6, 1])) == Ints('100011')
+
+
+def test_frommembers_invalid(Ints):  # noqa: N803
+    with pytest.raises(KeyError, match=r'7'):
+        Ints.frommembers([1, 7])
+
+
 def test_frombools(Ints):  # noqa: N803
     assert Ints.frombools([True, '', None, 0, 'yes', 5]) == Ints('100011')
 
 
+@pytest.mark.parametrize('bools, expected', [
+    ([], '000000'),
+    (iter([1, 0, 0, 0, 1, 1, 1, 1]), '100011'),
+    (itertools.cycle([1, 0]), '101010'),
+    (b'\x01\x00\x01', '101000'),
+    ([True] * 9, '111111'),
+])
+def test_frombools_truncate(Ints, bools, expected):  # noqa: N803
+    assert Ints.frombools(bools) == Ints(expected)
+
+
 def test_frombits(Ints):  # noqa: N803
     assert Ints.frombits('100011') == Ints('100011')
 
@@ -36,6 +59,21 @@ def test_frombits_invalid(Ints):  # noqa: N803
         Ints.frombits('1000001')
 
 
+def test_frombytes(Ints):  # noqa: N803
+    assert Ints.frombytes(b'\x31') == Ints('100011')
+    assert Ints.frombytes(memoryview(b'')) == Ints('000000')
+
+
+def test_frombytes_invalid(Ints):  # noqa: N803
+    with pytest.raises(ValueError, match=r'too many bits'):
+        Ints.frombytes(b'\x40')
+
+
+def test_tobytes(Ints):  # noqa: N803
+    assert Ints('100011').tobytes() == b'\x31'
+    assert bytes(Ints('100011').__buffer__(0)) == b'\x31'
+
+
 def test_copy(Ints):  # noqa: N803
     bs = Ints('100011')
     assert bs.copy() is bs
@@ -61,6 +99,10 @@ def test_bools(Ints):  # noqa: N803
     assert Ints('100011').bools() == (True, False, False, False, True, True)
 
 
+def test_iter_set(Ints):  # noqa: N803
+    assert list(Ints('100011').iter_set()) == [0, 4, 5]
+
+
 def test_bits(Ints):  # noqa: N803
     assert Ints('100011').bits() == '100011'
 
@@ -173,6 +215,13 @@ def test_powerset_start(Ints, bits, other, expected):  # noqa: N803
     assert list(Ints(bits).powerset(Ints(other))) == [Ints(e) for e in expected]
 
 
+def test_powerset_excludestart(Ints):  # noqa: N803
+    assert list(Ints('11').powerset(excludestart=True)) == \
+           [Ints('1'), Ints('01'), Ints('11')]
+    assert list(Ints('111').powerset(Ints('1'), excludestart=True)) == \
+           [Ints('11'), Ints('101'), Ints('111')]
+
+
 def test_powerset_invalid_start(Ints):  # noqa: N803
     with pytest.raises(ValueError, match=r'no subset'):
         Ints('1').powerset(Ints('111'))
@@ -186,6 +235,10 @@ def test_count_false(Ints):  # noqa: N803
     assert Ints('111011').count(False) == 1
 
 
+def test_count_false_trailing(Ints):  # noqa: N803
+    assert Ints('100000').count(False) == 5
+
+
 @pytest.mark.parametrize('value', ['0', '1', 2, None, -1, object()])
 def test_count_invalid(Ints, value):  # noqa: N803
     with pytest.raises(ValueError, match=r'True or False'):
@@ -229,6 +282,17 @@ def test_contains(Nums):  # noqa: N803
     assert 1 not in Nums()
 
 
+@pytest.mark.parametrize('members', [range(10_000), tuple(f'm{i}' for i in range(10_000))])
+def test_contains_large(members):
+    cls = bitsets.bitset('ContainsLarge', members)
+    b = cls.frommembers([members[1], members[7_000], members[9_999]])
+    assert [m in b for m in (members[1], members[2], members[7_000], members[7_001],
+                             members[9_999])] == [True, False, True, False, True]
+    assert members[0] not in cls()
+    with pytest.raises(KeyError):
+        -1 in b
+
+
 def test_contains_invalid(Nums):  # noqa: N803
     with pytest.raises(KeyError) as e:
         -1 in Nums()
@@ -293,6 +357,90 @@ def test_difference_members(Nums):  # noqa: N803
     assert Nums([1, 2]).difference([2, 3]) == Nums([1])
 
 
+@pytest.mark.parametrize('method, others, expected', [
+    ('intersection', (), [1, 2, 3]),
+    ('intersection', ([2, 3, 4], (3, 2), frozenset({2, 5})), [2]),
+    ('union', (), [1, 2, 3]),
+    ('union', ([4], (5,), frozenset({6})), [1, 2, 3, 4, 5, 6]),
+    ('difference', (), [1, 2, 3]),
+    ('difference', ([1], (3, 4)), [2]),
+])
+def test_nary(Nums, method, others, expected):  # noqa: N803
+    assert getattr(Nums([1, 2, 3]), method)(*others) == Nums(expected)
+
+
+def test_frommembers_cached():
+    cls = bitsets.bases.BitSet._make_subclass('Cached', (1, 2, 3))
+    assert cls([1]).issubset((1, 2))
+    assert cls([1]).union(frozenset({3}), (1, 2)) == cls([1, 2, 3])
+    assert cls([3]).isdisjoint([1, 2])
+
+    assert cls([1, 2]).issuperset((1, 2))
+    info = cls.frommembers_cached.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+    assert info.maxsize == bitsets.bases.MEMBERS_CACHE
+
+    with pytest.raises(KeyError):
+        cls([1]).union((4,))
+
+
+def test_frommembers_cached_base():
+    assert isinstance(bitsets.bases.BitSet.frommembers_cached,
+                      bitsets.meta.cached_classproperty)
+    assert 'frommembers_cached' not in vars(bitsets.bases.BitSet)
+
+    cls = bitsets.bitset('CachedBase', (1, 2, 3))
+    assert cls([1]).union((2,)) == cls([1, 2])
+
+
+def test_intern():
+    cls = bitsets.bitset('Interned', (1, 2, 3, 4), list=True)
+    cls.intern(2)
+    try:
+        assert cls([1, 2]) is cls.fromint(3) is cls.frombits('11') is cls.frombools([1, 1])
+        assert cls([1]).union([2]) is cls.fromint(3)
+
+        items = cls.List.fromints([3, 3, 1, 3])
+        assert items[0] is items[1] is items[3] is cls.fromint(3)
+
+        assert cls.fromint(4) is cls.fromint(4)
+        assert cls.fromint(8) is not None and cls.fromint(3) is not items[0]
+        assert cls.fromint.cache_info().maxsize == 2
+    finally:
+        cls.intern(0)
+
+    assert 'fromint' not in vars(cls)
+    assert cls.fromint(3) is not cls.fromint(3)
+
+
+@pytest.mark.parametrize('base', [bitsets.bases.MemberBits, bitsets.bases.BitSet])
+def test_intern_base(base):
+    with pytest.raises(RuntimeError, match=r'attempt intern'):
+        base.intern(4)
+    with pytest.raises(RuntimeError, match=r'attempt intern'):
+        base.intern(0)
+
+    assert 'fromint' in vars(bitsets.bases.MemberBits)
+    cls = bitsets.bitset('InternBase', 'abc')
+    assert type(cls('ab')) is cls
+
+
+def test_intern_subclass():
+    cls = bitsets.bitset('InternedParent', 'abc')
+    cls.intern(4)
+    try:
+        class Child(cls):
+            pass
+
+        assert type(Child.fromint(3)) is Child
+        assert type(Child.frombits('11')) is Child
+        assert cls.fromint(3) is cls.fromint(3)
+    finally:
+        cls.intern(0)
+
+    assert 'fromint' not in vars(cls)
+
+
 def test_symmetric_difference(Nums):  # noqa: N803
     assert Nums([1, 2]).symmetric_difference(Nums([2, 3])) == Nums([1, 3])
 
@@ -303,3 +451,99 @@ def test_symmetric_difference_members(Nums):  # noqa: N803
 
 def test_complement(Nums):  # noqa: N803
     assert Nums([1, 2]).complement() == Nums([3, 4, 5, 6])
+
+
+def test_shortlex_rank(Ints):  # noqa: N803
+    powerset = list(Ints.supremum.powerset())
+    assert [Ints.fromshortlex(i) for i in range(64)] == powerset
+    assert [b.shortlex_rank() for b in powerset] == list(range(64))
+
+
+def test_fromshortlex_invalid(Ints):  # noqa: N803
+    with pytest.raises(IndexError, match=r'out of range'):
+        Ints.fromshortlex(64)
+
+
+def test_combination_rank(Ints):  # noqa: N803
+    triples = [i for i in Ints.supremum.powerset() if i.count() == 3]
+    assert [Ints.fromcombination(i, 3) for i in range(20)] == triples
+    assert [b.combination_rank() for b in triples] == list(range(20))
+
+
+@pytest.mark.parametrize('start, stop', [(0, 64), (0, 1), (5, 30), (41, 99), (9, 9)])
+def test_powerset_range(Ints, start, stop):  # noqa: N803
+    powerset = list(Ints.supremum.powerset())
+    assert list(Ints.powerset_range(start, stop)) == powerset[start:stop]
+
+
+@pytest.mark.parametrize('index', [0, 100, 10 ** 20, 2 ** 100 - 1])
+def test_shortlex_rank_large(Large, index):  # noqa: N803
+    assert Large.fromshortlex(index).shortlex_rank() == index
+
+
+def test_builder_class(Nums):  # noqa: N803
+    assert Nums.Builder is Nums.Builder
+    assert Nums.Builder.__name__ == 'NumsBuilder'
+    assert Nums.Builder.BitSet is Nums
+    assert issubclass(Nums.Builder, bitsets.bases.BitSetBuilder)
+
+
+def test_builder(Nums):  # noqa: N803
+    builder = Nums.Builder([1, 2])
+    builder.add(6)
+    builder.add(6)
+    builder.discard(1)
+    builder.discard(3)
+    builder.update([4, 5])
+    assert 2 in builder and 1 not in builder
+    assert len(builder) == 4
+    assert list(builder) == [2, 4, 5, 6]
+    assert repr(builder) == 'NumsBuilder([2, 4, 5, 6])'
+    result = builder.freeze()
+    assert type(result) is Nums
+    assert result == Nums([2, 4, 5, 6])
+    builder.remove(2)
+    assert result == Nums([2, 4, 5, 6])
+    assert builder == Nums([4, 5, 6])
+    builder.clear()
+    assert builder == Nums.Builder() == Nums.infimum
+    assert repr(builder) == 'NumsBuilder()'
+
+
+def test_builder_invalid(Nums):  # noqa: N803
+    builder = Nums.Builder([1])
+    with pytest.raises(KeyError):
+        builder.add(7)
+    with pytest.raises(KeyError):
+        builder.remove(2)
+    with pytest.raises(TypeError):
+        builder |= [1]
+    with pytest.raises(TypeError):
+        hash(builder)
+
+
+def test_builder_inplace(Nums):  # noqa: N803
+    builder = Nums.Builder([1, 2, 3])
+    other = builder
+    builder |= Nums([4])
+    builder &= Nums.Builder([2, 3, 4, 5])
+    builder ^= Nums([5])
+    builder -= Nums([2])
+    assert builder is other
+    assert builder.freeze() == Nums([3, 4, 5])
+
+
+def test_builder_pickle_copy(Nums):  # noqa: N803
+    builder = Nums.Builder([1, 6])
+    assert pickle.loads(pickle.dumps(builder)) == builder
+    copy = builder.copy()
+    copy.add(2)
+    assert builder == Nums([1, 6]) and copy == Nums([1, 2, 6])
+
+
+def test_builder_huge():
+    Huge = bitsets.bitset('Huge', range(100_000))  # noqa: N806
+    builder = Huge.Builder()
+    for i in range(0, 100_000, 999):
+        builder.add(i)
+    assert builder.freeze() == Huge(range(0, 100_000, 999))
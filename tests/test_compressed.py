@@ -0,0 +1,159 @@
+import array
+import pickle
+import re
+
+import pytest
+
+import bitsets.compressed
+import bitsets.parallel
+import bitsets.storage
+
+SETS = {'empty': set(),
+        'sparse': {0, 1, 70_000, 139_999},
+        'array': set(range(3, 130_000, 37)),
+        'bitmap': {i for i in range(65_536, 131_072) if i % 3},
+        'runs': set(range(60_000, 120_000)) | set(range(130_000, 130_010)),
+        'full': set(range(140_000))}
+
+
+@pytest.fixture(params=list(SETS))
+def members(request):
+    return SETS[request.param]
+
+
+@pytest.fixture(params=list(SETS))
+def other(request):
+    return SETS[request.param]
+
+
+def test_repr_cls(Huge):  # noqa: N803
+    assert re.match(r"<class bitsets\.meta\.bitset\('Huge', range\(0, 140000\), "
+                    r"0x[0-9a-fA-F]+, CompressedBitSet, List, None\)>", repr(Huge))
+
+
+def test_containers(Huge):  # noqa: N803
+    kinds = [type(c) for c in Huge(SETS['runs'] | SETS['sparse'])._containers]
+    assert kinds == [tuple, tuple, array.array]
+    assert [type(c) for c in Huge(SETS['bitmap'])._containers] == [int]
+    assert Huge.supremum._containers == ((range(0, 65_536),),) * 2 + ((range(0, 8_928),),)
+
+
+def test_conversions(Huge, members):  # noqa: N803
+    b = Huge(members)
+    n = sum(1 << i for i in members)
+    assert set(b) == members
+    assert len(b) == b.count() == len(members)
+    assert b.count(False) == 140_000 - len(members)
+    assert b.int == n
+    assert b.members() == tuple(sorted(members))
+    assert Huge.fromint(n) == b
+    assert Huge.frombits(b.bits()) == b
+    assert Huge.frombytes(b.tobytes()) == b
+    assert Huge.frombools(b.bools()) == b
+    assert Huge.frombitset(n) == b
+    assert pickle.loads(pickle.dumps(b)) == b
+    assert hash(Huge(sorted(members, reverse=True))) == hash(b)
+    assert bool(b) == b.any() == bool(members)
+    assert b.all() == (len(members) == 140_000)
+
+
+def test_operations(Huge, members, other):  # noqa: N803
+    a, b = Huge(members), Huge(other)
+    assert a & b == a.intersection(other) == Huge(members & other)
+    assert a | b == a.union(other) == Huge(members | other)
+    assert a ^ b == a.symmetric_difference(other) == Huge(members ^ other)
+    assert a - b == a.difference(other) == Huge(members - other)
+    assert a.issubset(b) == (members <= other)
+    assert a.issuperset(b) == (members >= other)
+    assert a.isdisjoint(b) == members.isdisjoint(other)
+
+
+def test_complement(Huge, members):  # noqa: N803
+    assert set(Huge(members).complement()) == set(range(140_000)) - members
+
+
+@pytest.mark.parametrize('member', [0, 2, 70_000, 100_002, 139_999])
+def test_contains(Huge, members, member):  # noqa: N803
+    assert (member in Huge(members)) == (member in members)
+
+
+def test_contains_invalid(Huge):  # noqa: N803
+    with pytest.raises(KeyError):
+        140_000 in Huge()
+
+
+def test_frommembers_invalid(Huge):  # noqa: N803
+    with pytest.raises(KeyError):
+        Huge([-1])
+
+
+def test_frombits_invalid(Huge):  # noqa: N803
+    with pytest.raises(ValueError, match=r'too many bits'):
+        Huge.frombits('0' * 140_001)
+
+
+def test_reduce(Huge):  # noqa: N803
+    sets = [Huge(SETS['runs']), Huge(SETS['array']), Huge(SETS['sparse'])]
+    assert Huge.reduce_and(sets[:2]) == Huge(SETS['runs'] & SETS['array'])
+    assert Huge.reduce_or(sets) == Huge(SETS['runs'] | SETS['array'] | SETS['sparse'])
+
+
+def test_list(Huge):  # noqa: N803
+    series = Huge.List.frommembers([SETS['sparse'], ()])
+    assert series.members() == [(0, 1, 70_000, 139_999), ()]
+    assert pickle.loads(pickle.dumps(series)) == series
+
+
+def test_repr(Huge):  # noqa: N803
+    assert repr(Huge([2, 1])) == 'Huge([1, 2])'
+    assert repr(Huge()) == 'Huge()'
+
+
+def test_list_bytes(Huge):  # noqa: N803
+    series = Huge.List.frommembers([SETS['sparse'], (3,), ()])
+    assert Huge.List.frombytes(series.tobytes()) == series
+    assert Huge.List.decode(series.encode()) == series
+    assert Huge.List.decode(series.encode('hex'), 'hex') == series
+    assert series.sorted().members() == [(), (3,), (0, 1, 70_000, 139_999)]
+
+
+def test_parallel_storage(tmp_path, Huge):  # noqa: N803
+    series = Huge.List.frommembers([SETS['sparse'], (1, 3), ()])
+    assert bitsets.parallel.reduce_or(series) == Huge(SETS['sparse'] | {3})
+    assert bitsets.parallel.intersection(series, [1, 3]).members() == [(1,), (1, 3), ()]
+
+    filename = tmp_path / 'huge.bin'
+    assert bitsets.storage.dump(series, filename) == 3
+    assert list(bitsets.storage.load(filename)) == list(series)
+
+
+def test_array_invalid():
+    with pytest.raises(ValueError, match=r'integer bitset rows'):
+        bitsets.bitset('HugeArray', range(10), array=True,
+                       base=bitsets.compressed.CompressedBitSet)
+
+
+def test_atoms_powerset(Huge):  # noqa: N803
+    b = Huge([1, 70_000])
+    assert list(b.atoms()) == [Huge([1]), Huge([70_000])]
+    assert list(b.atoms(reverse=True)) == [Huge([70_000]), Huge([1])]
+    assert list(Huge(range(2, 140_000)).inatoms()) == [Huge([0]), Huge([1])]
+    assert list(Huge.atomic(b)) == list(b.atoms())
+    assert list(Huge.inatomic(Huge(range(1, 140_000)))) == [Huge([0])]
+    assert list(b.powerset()) == [Huge(), Huge([1]), Huge([70_000]), b]
+    assert list(b.powerset(Huge([1]), excludestart=True)) == [b]
+    with pytest.raises(ValueError, match=r'no subset'):
+        b.powerset(Huge([2]))
+
+
+def test_ranks(Huge):  # noqa: N803
+    b = Huge([0, 2])
+    assert Huge.fromshortlex(b.shortlex_rank()) == b
+    assert Huge.fromcombination(b.combination_rank(), 2) == b
+    assert list(Huge.powerset_range(0, 3)) == [Huge(), Huge([0]), Huge([1])]
+
+
+def test_ordering(Huge):  # noqa: N803
+    assert sorted([Huge([3]), Huge([70_000]), Huge([1])]) == [Huge([1]), Huge([3]),
+                                                              Huge([70_000])]
+    assert Huge([1]) < Huge([0, 1]) <= Huge([0, 1]) and Huge([3]) > Huge([1])
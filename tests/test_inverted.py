@@ -0,0 +1,93 @@
+import pytest
+
+import bitsets.inverted
+
+ROWS = [(0, 1, 99), (1, 64), (), (1,), (0, 1, 99), (2, 3)]
+
+
+@pytest.fixture
+def index(Large):  # noqa: N803
+    return bitsets.inverted.InvertedIndex(Large.List.frommembers(ROWS))
+
+
+def brute_force(Large, method, query):  # noqa: N803
+    query = Large(query)
+    return [i for i, r in enumerate(ROWS) if method(Large(r), query)]
+
+
+@pytest.mark.parametrize('query', [(), (1,), (0, 99), (1, 64), (2, 3, 4), range(100)])
+def test_supersets(Large, index, query):  # noqa: N803
+    assert index.supersets(query) == brute_force(Large, Large.issuperset, query)
+
+
+@pytest.mark.parametrize('query', [(), (1,), (0, 1, 99), (1, 64), (2, 3, 4), range(100)])
+def test_subsets(Large, index, query):  # noqa: N803
+    assert index.subsets(Large(query)) == brute_force(Large, Large.issubset, query)
+
+
+@pytest.mark.parametrize('query', [(), (1,), (0, 1, 99), (5,)])
+def test_equal(Large, index, query):  # noqa: N803
+    assert index.equal(query) == brute_force(Large, Large.__eq__, query)
+
+
+@pytest.mark.parametrize('query', [(), (1,), (3, 99), (5,)])
+def test_intersecting(Large, index, query):  # noqa: N803
+    expected = brute_force(Large, lambda a, b: not a.isdisjoint(b), query)
+    assert index.intersecting(query) == expected
+
+
+def test_add_remove(Large, index):  # noqa: N803
+    assert len(index) == 6
+    assert index.add(Large([1, 64, 65])) == 6
+    assert index.supersets([64]) == [1, 6]
+    index.remove(1)
+    assert len(index) == 6
+    assert index.supersets([64]) == [6]
+    assert index.subsets([1, 64]) == [2, 3]
+    assert index.extend(Large.List.frommembers([(64,), (1, 2, 3)])) == range(7, 9)
+    assert index.supersets([64]) == [6, 7]
+    assert index.intersecting([2]) == [5, 8]
+    assert index[8] == Large([1, 2, 3])
+    assert repr(index) == '<InvertedIndex of 8 Large>'
+
+
+def test_remove_removed(Large, index):  # noqa: N803
+    index.remove(0)
+    with pytest.raises(KeyError, match=r'removed'):
+        index.remove(0)
+
+
+def test_add_bulk(Large):  # noqa: N803
+    index = bitsets.inverted.InvertedIndex(cls=Large)
+    rows = [Large([i % 100, 99]) for i in range(1_000)]
+    assert [index.add(r) for r in rows] == list(range(1_000))
+    assert index._merged == 0
+    assert index.supersets([5, 99]) == list(range(5, 1_000, 100))
+    assert index._merged == 1_000
+    index.add(Large([5]))
+    index.remove(1_000)
+    assert len(index) == 1_000
+    assert index.supersets([5]) == list(range(5, 1_000, 100))
+
+
+def test_remove_negative(Large, index):  # noqa: N803
+    with pytest.raises(KeyError, match=r'negative'):
+        index.remove(-1)
+    assert len(index) == 6
+
+
+def test_remove_unknown(Large, index):  # noqa: N803
+    with pytest.raises(KeyError, match=r'unknown'):
+        index.remove(6)
+    assert len(index) == 6
+
+
+def test_missing_cls():
+    with pytest.raises(TypeError, match=r'cls required'):
+        bitsets.inverted.InvertedIndex()
+
+
+def test_empty(Large):  # noqa: N803
+    index = bitsets.inverted.InvertedIndex(cls=Large)
+    assert len(index) == 0
+    assert index.subsets(range(100)) == []
@@ -1,7 +1,12 @@
+import concurrent.futures
+import gc
 import pickle
+import pydoc
 
 import pytest
 
+import bitsets
+
 from bitsets.bases import MemberBits
 import bitsets.series
 
@@ -26,6 +31,46 @@ def test_get_subclass(Ints):  # noqa: N803
         MemberBits.__class__)
 
 
+def test_get_subclass_registered(Nums):  # noqa: N803
+    args = Nums._series_args()
+    assert bitsets.meta.bitset(*args) is Nums
+    assert bitsets.meta.bitset(args[0], tuple(list(args[1])), *args[2:]) is Nums
+    assert Nums in bitsets.meta.registered_classes()
+
+
+def test_get_subclass_concurrent():
+    args = ('Concurrent', tuple(range(100)), 42, bitsets.bases.BitSet, None, None)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        classes = list(executor.map(lambda _: bitsets.meta.bitset(*args), range(32)))
+    assert all(cls is classes[0] for cls in classes)
+
+
+def test_get_subclass_same_fingerprint():
+    base = bitsets.bases.BitSet
+    first = base._make_subclass('Same', (1, 2), 7)
+    second = base._make_subclass('Same', (3, 4), 7)
+    assert first._fingerprint == second._fingerprint
+    assert base._get_subclass('Same', (1, 2), 7, None, None) is first
+    assert base._get_subclass('Same', (3, 4), 7, None, None) is second
+    assert {first, second} <= set(bitsets.meta.registered_classes())
+
+
+def test_registered_classes_evicted():
+    cls = bitsets.bitset('Evicted', tuple(range(10)), list=True)
+    data = pickle.dumps(cls)
+    key = cls._fingerprint
+    assert pickle.loads(data) is cls
+
+    del cls
+    gc.collect()
+    assert all(c._fingerprint != key for c in bitsets.meta.registered_classes())
+    assert key not in bitsets.meta._registry
+
+    cls = pickle.loads(data)
+    assert cls._fingerprint == key
+    assert cls in bitsets.meta.registered_classes()
+
+
 @pytest.mark.parametrize(
     'bits, expected',
     [('000000', []),
@@ -77,3 +122,130 @@ def test_reconstruct_list(Nums):  # noqa: N803
 
 def test_reconstruct_tuple(Nums):  # noqa: N803
     assert pickle.loads(pickle.dumps(Nums.Tuple)) is Nums.Tuple
+
+
+def test_atoms_sparse_large():
+    Large = bitsets.bitset('Large', tuple(range(5_000)))  # noqa: N806
+    bs = Large([3, 4_096, 4_999])
+    assert list(bs) == [3, 4_096, 4_999]
+    assert list(Large.atomic(bs)) == [1 << 3, 1 << 4_096, 1 << 4_999]
+    assert list(bs.atoms(reverse=True)) == [1 << 4_999, 1 << 4_096, 1 << 3]
+    assert sum(1 for _ in Large.inatomic(bs)) == 4_997
+
+
+@pytest.mark.parametrize(
+    'bits, expected, consumed',
+    [([], '111111', 0),
+     (['110011', '011110', '010010'], '010010', 3),
+     (['100000', '000001', '111111', '111111'], '000000', 2)])
+def test_stream_and(Ints, bits, expected, consumed):  # noqa: N803
+    bitsets = (Ints(b) for b in bits)
+    assert Ints.stream_and(bitsets) == (Ints(expected), consumed)
+    assert len(list(bitsets)) == len(bits) - consumed
+
+
+@pytest.mark.parametrize(
+    'bits, expected, consumed',
+    [([], '000000', 0),
+     (['100001', '010010'], '110011', 2),
+     (['111000', '000111', '000000'], '111111', 2)])
+def test_stream_or(Ints, bits, expected, consumed):  # noqa: N803
+    assert Ints.stream_or(Ints(b) for b in bits) == (Ints(expected), consumed)
+
+
+@pytest.mark.parametrize('buffers, expected, consumed', [
+    ([], list(range(100)), 0),
+    ([b''], list(range(100)), 0),
+    ([bytes([0b11] + [255] * 11 + [15])], [0, 1] + list(range(8, 100)), 1),
+    ([bytes([7] * 13) * 3, bytes([1] * 13) * 2], range(0, 100, 8), 5),
+    ([bytes(13), bytes([1] * 13)], [], 1),
+])
+def test_stream_and_buffers(Large, buffers, expected, consumed):  # noqa: N803
+    assert Large.stream_and(buffers, buffers=True) == (Large(expected), consumed)
+
+
+def test_stream_or_buffers(Large):  # noqa: N803
+    series = Large.List.frommembers([(0,), (99,), (1, 64), ()])
+    assert Large.stream_or([series.tobytes()], buffers=True) == \
+           (Large([0, 1, 64, 99]), 4)
+
+
+def test_stream_buffers_invalid(Large):  # noqa: N803
+    with pytest.raises(ValueError, match=r'multiple'):
+        Large.stream_or([bytes(14)], buffers=True)
+
+
+def test_lazy_class_attributes():
+    Lazy = bitsets.bitset('Lazy', tuple(range(100)))  # noqa: N806
+    assert not {'_atoms', '_map', '_index', 'supremum'} & set(vars(Lazy))
+    assert 99 in Lazy([1, 99])
+    assert isinstance(vars(Lazy)['_map'], dict)
+    assert Lazy.supremum == (1 << 100) - 1
+    assert 'supremum' in vars(Lazy)
+
+
+def test_lazy_class_attributes_base():
+    pydoc.render_doc(bitsets.bases.BitSet)  # reads every attribute of the base
+    assert 'Builder' not in vars(bitsets.bases.BitSet)
+    assert isinstance(bitsets.bases.BitSet.Builder, bitsets.meta.cached_classproperty)
+
+    Fresh = bitsets.bitset('Fresh', (1, 2, 3))  # noqa: N806
+    assert Fresh.Builder([1]).freeze() == Fresh([1])
+    assert Fresh.Builder.BitSet is Fresh
+
+
+def test_lazy_atoms_huge():
+    Huge = bitsets.bitset('Huge', range(1_000_000))  # noqa: N806
+    assert isinstance(Huge._atoms, bitsets.meta.Atoms)
+    assert isinstance(Huge._map, bitsets.meta.AtomMap)
+    bs = Huge([3, 999_999])
+    assert 999_999 in bs and 4 not in bs
+    assert list(bs.atoms()) == [1 << 3, 1 << 999_999]
+    assert Huge._atoms[-1] == Huge._atoms[999_999] == 1 << 999_999
+    assert Huge._atoms[1:3] == (Huge([1]), Huge([2]))
+    assert len(Huge._atoms) == len(Huge._map) == 1_000_000
+    assert list(Huge._map)[:2] == [0, 1]
+    with pytest.raises(IndexError):
+        Huge._atoms[1_000_000]
+    with pytest.raises(KeyError):
+        Huge._map[-1]
+    assert bs.complement().count() == 999_998
+
+
+@pytest.mark.parametrize('members, expected', [
+    ('abc', {'a': 0, 'b': 1, 'c': 2}),
+    ((3, 5, 4), {3: 0, 5: 1, 4: 2}),
+    ((True, False), {True: 0, False: 1}),
+    ((3, 4, 5), bitsets.meta.RangeIndex(range(3, 6))),
+    (range(10, 0, -2), bitsets.meta.RangeIndex(range(10, 0, -2))),
+])
+def test_member_index(members, expected):
+    index = bitsets.meta.member_index(members)
+    assert type(index) is type(expected)
+    assert dict(index) == dict(expected)
+
+
+def test_range_index():
+    index = bitsets.meta.RangeIndex(range(10, 0, -2))
+    assert index[10] == 0 and index[2] == 4
+    assert 4 in index and 3 not in index
+    with pytest.raises(KeyError, match=r'3'):
+        index[3]
+    assert index.indexes([2, 10, 6]) == [4, 0, 2]
+    with pytest.raises(KeyError, match=r'12'):
+        index.indexes([2, 12])
+
+
+@pytest.mark.parametrize('members', [[5, 99_999, 5], [], [1.0], range(0, 100_000, 3)])
+def test_range_domain_frommembers(members):
+    Huge = bitsets.bitset('Huge', range(100_000))  # noqa: N806
+    bs = Huge(members)
+    assert bs.members() == tuple(sorted(set(members)))
+    assert all(m in bs for m in members)
+
+
+@pytest.mark.parametrize('member', [-1, 100_000, 0.5, 'spam'])
+def test_range_domain_frommembers_invalid(member):
+    Huge = bitsets.bitset('Huge', range(100_000))  # noqa: N806
+    with pytest.raises(KeyError):
+        Huge([1, member])
@@ -0,0 +1,68 @@
+import concurrent.futures
+
+import pytest
+
+import bitsets.parallel
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.fixture
+def series(Large):  # noqa: N803
+    return Large.List.frommembers([(0, 1, 99), (1, 64, 99), (1, 99), (1, 2, 99)])
+
+
+@pytest.mark.parametrize('chunksize', [1, 3, 10])
+def test_reduce_and(Large, series, executor, chunksize):  # noqa: N803
+    result = bitsets.parallel.reduce_and(series, executor, chunksize=chunksize)
+    assert result == Large([1, 99])
+    assert isinstance(result, Large)
+
+
+@pytest.mark.parametrize('chunksize', [1, 3, 10])
+def test_reduce_or(Large, series, executor, chunksize):  # noqa: N803
+    result = bitsets.parallel.reduce_or(series, executor, chunksize=chunksize)
+    assert result == Large([0, 1, 2, 64, 99])
+
+
+def test_reduce_empty(Large, executor):  # noqa: N803
+    assert bitsets.parallel.reduce_and(Large.List(), executor) == Large.supremum
+    assert bitsets.parallel.reduce_or(Large.List(), executor) == Large.infimum
+
+
+def test_reduce_workers(Large, series):  # noqa: N803
+    assert bitsets.parallel.reduce_or(series, workers=2, chunksize=2) == \
+           Large([0, 1, 2, 64, 99])
+
+
+def test_intersection(Large, series, executor):  # noqa: N803
+    result = bitsets.parallel.intersection(series, [0, 64, 2], executor, chunksize=3)
+    assert result == Large.List.frommembers([(0,), (64,), (), (2,)])
+    assert isinstance(result, Large.List)
+
+
+def test_union_series(Large, series, executor):  # noqa: N803
+    other = Large.Array.frommembers([(50,), (), (50,), ()])
+    result = bitsets.parallel.union(series, other, executor, chunksize=3)
+    assert result == Large.List.frommembers([(0, 1, 50, 99), (1, 64, 99),
+                                             (1, 50, 99), (1, 2, 99)])
+
+
+def test_union_length_mismatch(Large, series, executor):  # noqa: N803
+    with pytest.raises(ValueError, match=r'length mismatch'):
+        bitsets.parallel.union(series, Large.List(), executor)
+
+
+def test_subsets(Large, series, executor):  # noqa: N803
+    assert bitsets.parallel.subsets(series, Large([0, 1, 2, 99]), executor,
+                                    chunksize=3) == [Large([0, 1, 99]),
+                                                     Large([1, 99]),
+                                                     Large([1, 2, 99])]
+
+
+def test_supersets(Large, series, executor):  # noqa: N803
+    assert bitsets.parallel.supersets(series, [64], executor) == [Large([1, 64, 99])]
@@ -1,5 +1,11 @@
+import itertools
+import pickle
 import re
 
+import pytest
+
+import bitsets
+
 
 def test_class(Nums):  # noqa: N803
     assert issubclass(Nums.List, list)
@@ -31,6 +37,81 @@ def test_frombools(Nums):  # noqa: N803
            Nums.List('101000', '110000')
 
 
+def test_frombools_truncate(Nums):  # noqa: N803
+    assert Nums.Tuple.frombools([[1] * 7, 'yes', []]) == \
+           Nums.Tuple('111111', '111000', '000000')
+
+
+def test_frombools_iterators(Nums):  # noqa: N803
+    assert Nums.List.frombools([itertools.cycle([1, 0]), iter([0, 1])]) == \
+           Nums.List('101010', '010000')
+
+
+def test_frombools_large(Large):  # noqa: N803
+    bools = [[i % 3 == 0 for i in range(100)], [False] * 99 + [True]]
+    assert Large.List.frombools(bools) == [Large(range(0, 100, 3)), Large([99])]
+
+
+def test_frombytes(Nums):  # noqa: N803
+    assert Nums.List.frombytes(b'\x05\x03') == Nums.List('101000', '110000')
+    assert Nums.Tuple.frombytes(bytearray()) == Nums.Tuple()
+
+
+def test_tobytes(Large):  # noqa: N803
+    series = Large.List.frommembers([(0, 99), (8,)])
+    assert series.tobytes() == b'\x01' + bytes(11) + b'\x08' + b'\x00\x01' + bytes(11)
+    assert Large.List.frombytes(series.tobytes()) == series
+    assert bytes(series.__buffer__(0)) == series.tobytes()
+
+
+def test_array_tobytes(Large):  # noqa: N803
+    array = Large.Array.frommembers([(0, 99), (8,)])
+    assert array.tobytes() == Large.List.frombitsets(array).tobytes()
+    assert Large.Array.frombytes(array.tobytes()) == array
+    assert array.__buffer__(0).nbytes == 2 * 16
+
+
+def test_array_fromwords(Large):  # noqa: N803
+    array = Large.Array.frommembers([(0, 99), (8,), ()])
+    assert Large.Array.fromwords(array.__buffer__(0)) == array
+    assert Large.Array.fromwords(array.words.tobytes()).tobytes() == array.tobytes()
+    assert Large.Array.fromwords(b'') == Large.Array()
+
+
+@pytest.mark.parametrize('data, match', [
+    (bytes(24), r'multiple of 16'),
+    (bytes(12) + b'\x10' + bytes(3), r'too many bits'),
+    (bytes(15) + b'\x01', r'too many bits'),
+])
+def test_array_fromwords_invalid(Large, data, match):  # noqa: N803
+    with pytest.raises(ValueError, match=match):
+        Large.Array.fromwords(data)
+
+
+@pytest.mark.parametrize('data, match', [
+    (bytes(14), r'multiple'),
+    (bytes(12) + b'\x10', r'too many bits'),
+])
+def test_frombytes_invalid(Large, data, match):  # noqa: N803
+    with pytest.raises(ValueError, match=match):
+        Large.List.frombytes(data)
+
+
+def test_fromindexes(Large):  # noqa: N803
+    assert Large.List.fromindexes([(0, 99), range(8, 16), ()]) == \
+           [Large([0, 99]), Large(range(8, 16)), Large()]
+
+
+def test_fromindexes_iterators(Large):  # noqa: N803
+    rows = (iter(row) for row in [(0, 99), range(8, 16)])
+    assert Large.List.fromindexes(rows) == [Large([0, 99]), Large(range(8, 16))]
+
+
+def test_fromindexes_invalid(Large):  # noqa: N803
+    with pytest.raises(IndexError, match=r'out of range'):
+        Large.List.fromindexes([(100,)])
+
+
 def test_frombits(Nums):  # noqa: N803
     assert Nums.List.frombits(['101000', '110000']) == Nums.List('101000', '110000')
 
@@ -39,6 +120,43 @@ def test_fromints(Nums):  # noqa: N803
     assert Nums.List.fromints([5, 3]) == Nums.List('101000', '110000')
 
 
+@pytest.mark.parametrize('codec, expected', [
+    ('bits', '101000\n110000\n000000'),
+    ('hex', '05\n03\n00'),
+    ('base64', 'BQ==\nAw==\nAA=='),
+])
+def test_encode(Nums, codec, expected):  # noqa: N803
+    series = Nums.List('101000', '110000', '000000')
+    assert series.encode(codec) == expected
+    assert Nums.List.decode(expected, codec) == series
+    assert Nums.List().encode(codec) == ''
+    assert Nums.Tuple.decode('', codec) == Nums.Tuple()
+
+
+@pytest.mark.parametrize('codec', ['bits', 'hex', 'base64'])
+@pytest.mark.parametrize('series', ['List', 'Array'])
+def test_encode_large(Large, codec, series):  # noqa: N803
+    series = getattr(Large, series).frommembers([(0, 99), range(8, 16), ()])
+    text = series.encode(codec, sep=', ')
+    assert len(text.split(', ')) == 3
+    assert type(series).decode(text, codec, sep=', ') == series
+    if codec == 'bits':
+        assert text.split(', ') == series.bits()
+
+
+@pytest.mark.parametrize('text, codec, match', [
+    ('1010001', 'bits', r'too many bits'),
+    ('10100x', 'bits', r'invalid literal'),
+    ('05\n3', 'hex', r'length 2'),
+    ('BQ==\nAw', 'base64', r'length 4'),
+    ('80', 'hex', r'too many bits'),
+    ('05', 'spam', r'unknown codec'),
+])
+def test_decode_invalid(Nums, text, codec, match):  # noqa: N803
+    with pytest.raises(ValueError, match=match):
+        Nums.List.decode(text, codec)
+
+
 def test_members(Nums):  # noqa: N803
     assert Nums.List('101000', '110000').members() == [(1, 3), (1, 2)]
 
@@ -76,3 +194,199 @@ def test_reduce_and(Nums):  # noqa: N803
 
 def test_reduce_or(Nums):  # noqa: N803
     assert Nums.List('101000', '110000').reduce_or() == Nums([1, 2, 3])
+
+
+def test_array_class(Large):  # noqa: N803
+    assert issubclass(Large.Array, bitsets.series.Array)
+    assert Large.Array._nwords == 2
+
+
+def test_array_classrepr(Large):  # noqa: N803
+    assert re.match(r"<class bitsets\.meta\.bitset_array\("
+                    r"'Large', range\(0, 100\), "
+                    r"0x[0-9a-fA-F]+, BitSet, List, None, Array"
+                    r"\)>", repr(Large.Array))
+
+
+def test_array(Large):  # noqa: N803
+    array = Large.Array.frommembers([(0, 99), (1, 64), ()])
+    assert len(array) == 3
+    assert len(array.words) == 6
+    assert array[0] == Large([0, 99])
+    assert array[-1] == Large()
+    assert array[1:] == Large.Array.frommembers([(1, 64), ()])
+    assert list(array) == [Large([0, 99]), Large([1, 64]), Large()]
+
+
+def test_array_index_error(Large):  # noqa: N803
+    with pytest.raises(IndexError):
+        Large.Array()[0]
+
+
+def test_array_hash(Large):  # noqa: N803
+    array = Large.Array.frommembers([(0, 99), (1, 64)])
+    same = Large.Array.frombitsets(Large.List.frombitsets(array))
+    assert hash(same) == hash(array)
+    assert {array: 'spam'}[same] == 'spam'
+    assert len({array, same, Large.Array.frommembers([(0, 99)])}) == 2
+
+
+def test_array_list_roundtrip(Large):  # noqa: N803
+    lst = Large.List.frommembers([(0, 99), (1, 64)])
+    array = Large.Array.frombitsets(lst)
+    assert Large.List.frombitsets(array) == lst
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+@pytest.mark.parametrize('series', ['List', 'Tuple'])
+@pytest.mark.parametrize('members', [[(1, 6), (), (2, 3)], []])
+def test_pickle(Nums, protocol, series, members):  # noqa: N803
+    series = getattr(Nums, series).frommembers(members)
+    result = pickle.loads(pickle.dumps(series, protocol))
+    assert type(result) is type(series)
+    assert result == series
+
+
+@pytest.mark.parametrize('protocol', [2, pickle.HIGHEST_PROTOCOL])
+@pytest.mark.parametrize('item', ['spam', 3, 1 << 100])
+def test_pickle_foreign_items(Nums, protocol, item):  # noqa: N803
+    series = Nums.List('100000')
+    series.append(item)
+    result = pickle.loads(pickle.dumps(series, protocol))
+    assert result == series
+    assert type(result[1]) is type(item)
+
+
+def test_pickle_out_of_band(Nums):  # noqa: N803
+    series = Nums.List.frommembers([(1, 6), (2,)] * 100)
+    buffers = []
+    data = pickle.dumps(series, 5, buffer_callback=buffers.append)
+    assert len(buffers) == 1 and buffers[0].raw().nbytes == 200
+    assert len(data) < 200
+    assert pickle.loads(data, buffers=buffers) == series
+
+
+def test_pickle_wide_rows(Large):  # noqa: N803
+    series = Large.List.frommembers([(0, 99), (1, 64)] * 100)
+    buffers = []
+    data = pickle.dumps(series, 5, buffer_callback=buffers.append)
+    assert not buffers
+    assert pickle.loads(data) == series
+
+
+def test_array_pickle(Large):  # noqa: N803
+    array = Large.Array.frommembers([(0, 99), (1, 64)])
+    assert pickle.loads(pickle.dumps(Large.Array)) is Large.Array
+    assert pickle.loads(pickle.dumps(array)) == array
+
+
+@pytest.mark.parametrize('members, expected', [
+    ([(0, 1, 99), (1, 64, 99), (1, 99)], [1, 99]),
+    ([], list(range(100))),
+])
+def test_array_reduce_and(Large, members, expected):  # noqa: N803
+    assert Large.Array.frommembers(members).reduce_and() == Large(expected)
+
+
+def test_array_reduce_or(Large):  # noqa: N803
+    array = Large.Array.frommembers([(0, 99), (1, 64), ()])
+    assert array.reduce_or() == Large([0, 1, 64, 99])
+
+
+def test_array_intersection_union(Large):  # noqa: N803
+    array = Large.Array.frommembers([(0, 99), (1, 64)])
+    assert array.intersection([0, 64]) == Large.Array.frommembers([(0,), (64,)])
+    assert array.union(Large([2])) == \
+           Large.Array.frommembers([(0, 2, 99), (1, 2, 64)])
+
+
+def test_array_counts(Large):  # noqa: N803
+    assert Large.Array.frommembers([(0, 99), range(70), ()]).counts() == [2, 70, 0]
+
+
+def test_array_issubset_issuperset(Large):  # noqa: N803
+    array = Large.Array.frommembers([(0, 99), (1, 64), ()])
+    assert array.issubset([0, 1, 99]) == [True, False, True]
+    assert array.issuperset(Large([64])) == [False, True, False]
+
+
+def test_array_repr():
+    bs = bitsets.bitset('Bs', (1, 2, 3), array=True)
+    assert repr(bs.Array('101', '010')) == "BsArray('101', '010')"
+    assert repr(bs.Array.fromints([5])) == "BsArray('101')"
+
+
+@pytest.mark.parametrize('order', ['shortlex', 'longlex', 'shortcolex', 'longcolex'])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_sorted(Nums, order, reverse):  # noqa: N803
+    series = Nums.Tuple.fromints(range(64)[::-3])
+    expected = sorted(series, key=getattr(Nums, order), reverse=reverse)
+    result = series.sorted(order, reverse=reverse)
+    assert result == Nums.Tuple.frombitsets(expected)
+    assert isinstance(result, Nums.Tuple)
+
+
+def test_sorted_array(Large):  # noqa: N803
+    array = Large.Array.frommembers([(99,), (0, 1), (), (0,), (1, 64)])
+    assert array.sorted() == Large.Array.frommembers([(), (0,), (99,), (0, 1), (1, 64)])
+
+
+def test_sorted_invalid(Nums):  # noqa: N803
+    with pytest.raises(ValueError, match=r'unknown order'):
+        Nums.List().sorted('spam')
+
+
+def test_sort(Nums):  # noqa: N803
+    series = Nums.List('001', '11', '1')
+    series.sort(order='shortlex')
+    assert series == Nums.List('1', '001', '11')
+    series.sort(key=Nums.longcolex)
+    assert series == Nums.List('11', '1', '001')
+    series.sort(reverse=True)
+    assert series == Nums.List('001', '11', '1')
+
+
+def test_sort_invalid(Nums):  # noqa: N803
+    with pytest.raises(ValueError, match=r'both'):
+        Nums.List().sort(key=int, order='shortlex')
+
+
+def test_columns(Nums):  # noqa: N803
+    series = Nums.List.frommembers([(1, 2), (2, 6), ()])
+    columns = series.columns()
+    assert list(columns) == [1, 2, 3, 4, 5, 6]
+    assert columns == {1: 0b001, 2: 0b011, 3: 0, 4: 0, 5: 0, 6: 0b010}
+    assert Nums.List.fromcolumns(columns, len(series)) == series
+    assert Nums.Tuple.fromcolumns({2: 0b11}) == Nums.Tuple.frommembers([(2,), (2,)])
+    assert Nums.List.fromcolumns(list(columns.values())) == series[:2]
+
+
+def test_columns_large(Large):  # noqa: N803
+    series = Large.List.frommembers([(0, 99), range(100), (), (50,)])
+    assert Large.List.fromcolumns(series.columns(), len(series)) == series
+    array = Large.Array.fromcolumns(series.columns(), len(series))
+    assert array == Large.Array.frombitsets(series)
+    assert array.columns() == series.columns()
+
+
+def test_fromcolumns_invalid(Nums):  # noqa: N803
+    with pytest.raises(ValueError, match=r'columns'):
+        Nums.List.fromcolumns([0, 1])
+    with pytest.raises(ValueError, match=r'beyond'):
+        Nums.List.fromcolumns({1: 0b100}, 2)
+
+
+@pytest.mark.parametrize('include, exclude, expected', [
+    ((), (), [0, 1, 2, 3]),
+    ((2,), (), [0, 1, 3]),
+    ((2,), (6,), [0, 3]),
+    ((1, 2), (3,), [0]),
+    ((), (1, 2), [2]),
+])
+def test_where(Nums, include, exclude, expected):  # noqa: N803
+    series = Nums.List.frommembers([(1, 2), (2, 6), (), (2, 3)])
+    assert series.where(include, exclude) == expected
+    assert series.where(include, exclude, series.columns()) == expected
+    assert expected == [i for i, b in enumerate(series)
+                        if all(m in b for m in include)
+                        and not any(m in b for m in exclude)]
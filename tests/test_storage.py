@@ -0,0 +1,56 @@
+import pytest
+
+import bitsets.storage
+
+
+@pytest.fixture
+def filename(tmp_path):
+    return tmp_path / 'large.bitsets'
+
+
+def test_dump_load(Large, filename):  # noqa: N803
+    series = Large.List.frommembers([(0, 99), (), (8, 64)])
+    assert bitsets.storage.dump(series, filename) == 3
+    with bitsets.storage.load(filename) as mapped:
+        assert mapped.BitSet is Large
+        assert len(mapped) == 3
+        assert mapped[0] == Large([0, 99])
+        assert mapped[-1] == Large([8, 64])
+        assert mapped[1:] == [Large(), Large([8, 64])]
+        assert list(mapped) == series
+        assert isinstance(mapped[0], Large)
+        assert repr(mapped) == '<MappedSeries of 3 Large>'
+
+
+def test_dump_iterable_chunks(Large, filename, monkeypatch):  # noqa: N803
+    monkeypatch.setattr(bitsets.storage, 'CHUNKSIZE', 2)
+    bitsets.storage.dump((Large([i]) for i in range(5)), filename, cls=Large)
+    with bitsets.storage.load(filename) as mapped:
+        assert list(mapped) == [Large([i]) for i in range(5)]
+
+
+def test_dump_empty(Large, filename):  # noqa: N803
+    assert bitsets.storage.dump(Large.List(), filename) == 0
+    with bitsets.storage.load(filename) as mapped:
+        assert list(mapped) == []
+
+
+def test_load_index_error(Large, filename):  # noqa: N803
+    bitsets.storage.dump(Large.List(), filename)
+    with bitsets.storage.load(filename) as mapped, pytest.raises(IndexError):
+        mapped[0]
+
+
+@pytest.mark.parametrize('data', [b'\0', b'spam' * 10])
+def test_load_invalid(filename, data):
+    filename.write_bytes(data)
+    with pytest.raises(ValueError, match=r'not a bitsets file'):
+        bitsets.storage.load(filename)
+
+
+def test_iterchunks_stream_or(Large, filename):  # noqa: N803
+    bitsets.storage.dump(Large.List.frommembers([(0,), range(100), (1,)]), filename)
+    with bitsets.storage.load(filename) as mapped:
+        assert [len(c) for c in mapped.iterchunks(2)] == [26, 13]
+        assert Large.stream_or(mapped.iterchunks(1), buffers=True) == \
+               (Large.supremum, 2)
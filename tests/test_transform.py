@@ -0,0 +1,52 @@
+import array
+import random
+
+import pytest
+
+from bitsets import transform
+
+DTYPES = ['B', 'H', 'L', 'Q']
+
+
+@pytest.fixture(scope='module')
+def bools():
+    rng = random.Random(42)
+    return [rng.random() < 0.5 for _ in range(1_001)]
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_packarray(bools, dtype):
+    result = transform.packarray(bools, dtype)
+    assert result.itemsize * 8 == transform.NBITS[dtype]
+    assert result.tolist() == list(transform.packbools(bools, dtype))
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_unpackarray(bools, dtype):
+    integers = list(transform.packbools(bools, dtype))
+    expected = bytes(transform.unpackbools(integers, dtype))
+    assert transform.unpackarray(integers, dtype) == expected
+
+    packed = transform.packarray(bools, dtype)
+    assert transform.unpackarray(packed, dtype) == expected
+    assert expected.startswith(bytes(bools))
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_reversearray(bools, dtype):
+    integers = transform.packarray(bools, dtype)
+    expected = list(transform.chunkreverse(integers, dtype))
+    assert transform.reversearray(integers, dtype).tolist() == expected
+    assert transform.reversearray(integers.tolist(), dtype).tolist() == expected
+
+
+def test_unpackarray_buffer():
+    data = bytes([42, 1])
+    expected = transform.unpackbytes(data)
+    assert transform.unpackarray(memoryview(data), 'B') == expected
+    assert transform.unpackarray(array.array('b', [42, 1]), 'B') == expected
+
+
+def test_packbytes_roundtrip(bools):
+    data = bytes(bools)
+    assert transform.unpackbytes(transform.packbytes(data))[:len(data)] == data